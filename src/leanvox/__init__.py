@@ -1,5 +1,6 @@
 """Leanvox Python SDK — Official client for the Leanvox TTS API."""
 
+from ._version import __version__
 from .client import AsyncLeanvox, Leanvox
 from .errors import (
     AuthenticationError,
@@ -14,6 +15,7 @@ from .errors import (
 from .types import (
     AccountBalance,
     AccountUsage,
+    AccountUsageTotals,
     FileExtractResult,
     GenerateResult,
     Generation,
@@ -31,8 +33,6 @@ from .types import (
     VoiceList,
 )
 
-__version__ = "0.5.0"
-
 __all__ = [
     "Leanvox",
     "AsyncLeanvox",
@@ -55,4 +55,5 @@ __all__ = [
     "GenerationList",
     "AccountBalance",
     "AccountUsage",
+    "AccountUsageTotals",
 ]
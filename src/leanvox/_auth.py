@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import os
+import stat
 import sys
 from pathlib import Path
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 from .errors import AuthenticationError
 
 _VALID_PREFIXES = ("lv_live_", "lv_test_")
@@ -13,17 +19,31 @@ _ENV_VAR = "LEANVOX_API_KEY"
 _CONFIG_PATH = Path.home() / ".lvox" / "config.toml"
 
 
+# ((path, st_mtime_ns, st_size), api_key) of the last config file parse.
+_config_cache: tuple[tuple[Path, int, int], str | None] | None = None
+
+
 def _read_config_file() -> str | None:
-    """Read API key from ~/.lvox/config.toml."""
-    if not _CONFIG_PATH.exists():
+    """Read API key from ~/.lvox/config.toml, reparsing only when it changes."""
+    global _config_cache
+    try:
+        st = _CONFIG_PATH.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
+    stamp = (_CONFIG_PATH, st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
+    key = _parse_config_file()
+    _config_cache = (stamp, key)
+    return key
+
+
+def _parse_config_file() -> str | None:
+    """Parse the API key out of the config file."""
     try:
-        if sys.version_info >= (3, 11):
-            import tomllib
-        else:
-            import tomli as tomllib  # type: ignore[no-redef]
-        with open(_CONFIG_PATH, "rb") as f:
-            data = tomllib.load(f)
+        data = tomllib.loads(_CONFIG_PATH.read_bytes().decode())
         return data.get("api_key") or data.get("auth", {}).get("api_key")
     except Exception:
         return None
@@ -33,6 +53,10 @@ def resolve_api_key(api_key: str | None = None) -> str | None:
     """Resolve API key from constructor param, env, or config file.
 
     Returns None if no key found (lazy auth — error on first call).
+
+    The environment is read on every call so a rotated key takes effect
+    for the next client; that read is a dict lookup. The config file is
+    only reparsed when its path, mtime or size changes.
     """
     # 1. Constructor param (highest priority)
     if api_key is not None:
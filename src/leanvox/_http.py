@@ -2,19 +2,64 @@
 
 from __future__ import annotations
 
+# asyncio used to be imported lazily inside AsyncHTTPClient.request to spare
+# sync-only users the import. It is a one-time cost of a few milliseconds, so
+# it is imported here rather than looked up on every async request.
+import asyncio
+import json as _json
+import math
+import random
 import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, AsyncIterator, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Iterator
 
 import httpx
 
+from ._version import __version__
 from .errors import _raise_for_status, RateLimitError, LeanvoxError
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the http2 extra
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the orjson extra
+    orjson = None  # type: ignore[assignment]
 
 _RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_STATUS_ACTION = {code: "retry" for code in _RETRY_STATUS_CODES}
+# Transport errors that are safe to retry by default. Write-side failures
+# (WriteTimeout, WriteError) are excluded so a large upload is not re-sent.
+_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.PoolTimeout)
 _DEFAULT_TIMEOUT = 30.0
 _STREAM_TIMEOUT = 120.0
 _BACKOFF_BASE = [1.0, 2.0, 4.0]
+_DEFAULT_MAX_BACKOFF = 30.0
+_DEFAULT_MAX_CONCURRENCY = 32
+_MAX_ERROR_BODY = 64_000
+_MAX_ERROR_MESSAGE = 1024
+_BASE_HEADERS = {"User-Agent": f"leanvox-python/{__version__}"}
+# Sent only with JSON bodies; a client-wide Content-Type would also override
+# the multipart boundary header on file uploads.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+# Async clients fan out (generate_many, wait_many) far more than sync ones,
+# so they keep more connections warm.
+_ASYNC_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=256,
+    keepalive_expiry=30.0,
+)
 
 
 class HTTPClient:
@@ -27,19 +72,25 @@ class HTTPClient:
         api_key: str,
         timeout: float = _DEFAULT_TIMEOUT,
         max_retries: int = 2,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        total_timeout: float | None = None,
+        should_retry: Callable[[Exception], bool] | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._total_timeout = total_timeout
+        self._should_retry = should_retry or _should_retry
         self._client = httpx.Client(
             base_url=self._base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "leanvox-python/0.1.0",
-            },
+            headers=httpx.Headers({**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"}),
             timeout=timeout,
+            # Passed to the client rather than via an explicit transport, which
+            # would turn off HTTP(S)_PROXY / NO_PROXY handling.
+            limits=_POOL_LIMITS,
+            http2=_HTTP2,
         )
 
     @property
@@ -59,51 +110,41 @@ class HTTPClient:
     ) -> dict:
         """Make an HTTP request with retry logic."""
         last_err: Exception | None = None
+        deadline = _deadline(self._total_timeout)
+        # Build the request (URL, merged headers, encoded body) once and
+        # re-send it on each attempt.
+        request = _build_request(self._client, method, path, json, data, files, params)
 
         for attempt in range(self._max_retries + 1):
+            request_timeout = timeout or self._timeout
+            left = _remaining(deadline)
+            if left is not None:
+                request_timeout = min(request_timeout, left)
             try:
-                kwargs: dict[str, Any] = {"params": params}
-                if files:
-                    kwargs["files"] = files
-                    kwargs["data"] = data
-                elif json is not None:
-                    kwargs["json"] = json
-
-                resp = self._client.request(
-                    method,
-                    path,
-                    timeout=timeout or self._timeout,
-                    **kwargs,
-                )
-
-                if resp.status_code < 400:
-                    return resp.json() if resp.content else {}
-
-                # Parse error body
-                try:
-                    body = resp.json()
-                except Exception:
-                    body = {"error": {"message": resp.text}}
-
-                # Don't retry 4xx (except 429)
-                if resp.status_code < 500 and resp.status_code != 429:
-                    _raise_for_status(resp.status_code, body)
-
-                # Retry on 5xx and 429
-                if resp.status_code in _RETRY_STATUS_CODES and attempt < self._max_retries:
-                    wait = _get_backoff(attempt, resp)
-                    time.sleep(wait)
+                request.extensions["timeout"] = httpx.Timeout(request_timeout).as_dict()
+                resp = self._client.send(request)
+
+                action = _classify(resp.status_code)
+                if action == "ok":
+                    return _loads(resp.content) if resp.content else {}
+
+                body = _error_body(resp)
+
+                # Retry on 429 and transient 5xx; everything else raises
+                if action == "retry" and attempt < self._max_retries:
+                    wait = _get_backoff(attempt, resp, max_delay=self._max_backoff)
+                    time.sleep(_clamp_wait(wait, self._max_backoff, deadline))
                     continue
 
                 _raise_for_status(resp.status_code, body)
 
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
+            except httpx.TransportError as e:
                 last_err = e
-                if attempt < self._max_retries:
-                    time.sleep(_BACKOFF_BASE[min(attempt, len(_BACKOFF_BASE) - 1)])
+                if attempt < self._max_retries and self._should_retry(e):
+                    time.sleep(_clamp_wait(_get_backoff(attempt), self._max_backoff, deadline))
                     continue
                 raise LeanvoxError(
-                    f"Connection failed after {self._max_retries + 1} attempts: {e}",
+                    f"Connection failed after {attempt + 1} attempts: {e}",
                     code="connection_error",
                 ) from e
 
@@ -123,7 +164,8 @@ class HTTPClient:
         with self._client.stream(
             method,
             path,
-            json=json,
+            content=_dumps(json) if json is not None else None,
+            headers=_JSON_HEADERS if json is not None else None,
             timeout=_STREAM_TIMEOUT,
         ) as resp:
             yield resp
@@ -142,25 +184,50 @@ class AsyncHTTPClient:
         api_key: str,
         timeout: float = _DEFAULT_TIMEOUT,
         max_retries: int = 2,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        total_timeout: float | None = None,
+        should_retry: Callable[[Exception], bool] | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._total_timeout = total_timeout
+        self._should_retry = should_retry or _should_retry
+        self._max_concurrency = max_concurrency
+        self._sem: asyncio.Semaphore | None = None
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "leanvox-python/0.1.0",
-            },
+            headers=httpx.Headers({**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"}),
             timeout=timeout,
+            # Passed to the client rather than via an explicit transport, which
+            # would turn off HTTP(S)_PROXY / NO_PROXY handling.
+            limits=_ASYNC_POOL_LIMITS,
+            http2=_HTTP2,
         )
 
     @property
     def raw_client(self) -> httpx.AsyncClient:
         return self._client
 
+    async def warmup(self) -> None:
+        """Open a connection (TCP, TLS, HTTP/2) before the first real request.
+
+        Best effort: the response status and any transport error are ignored.
+        """
+        try:
+            await self._client.head("/")
+        except httpx.HTTPError:
+            pass
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created on first use so it binds to the running event loop.
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+        return self._sem
+
     async def request(
         self,
         method: str,
@@ -173,51 +240,44 @@ class AsyncHTTPClient:
         timeout: float | None = None,
     ) -> dict:
         """Make an async HTTP request with retry logic."""
-        import asyncio
-
         last_err: Exception | None = None
+        deadline = _deadline(self._total_timeout)
+        # Build the request (URL, merged headers, encoded body) once and
+        # re-send it on each attempt.
+        request = _build_request(self._client, method, path, json, data, files, params)
 
         for attempt in range(self._max_retries + 1):
+            request_timeout = timeout or self._timeout
+            left = _remaining(deadline)
+            if left is not None:
+                request_timeout = min(request_timeout, left)
             try:
-                kwargs: dict[str, Any] = {"params": params}
-                if files:
-                    kwargs["files"] = files
-                    kwargs["data"] = data
-                elif json is not None:
-                    kwargs["json"] = json
-
-                resp = await self._client.request(
-                    method,
-                    path,
-                    timeout=timeout or self._timeout,
-                    **kwargs,
-                )
-
-                if resp.status_code < 400:
-                    return resp.json() if resp.content else {}
-
-                try:
-                    body = resp.json()
-                except Exception:
-                    body = {"error": {"message": resp.text}}
-
-                if resp.status_code < 500 and resp.status_code != 429:
-                    _raise_for_status(resp.status_code, body)
-
-                if resp.status_code in _RETRY_STATUS_CODES and attempt < self._max_retries:
-                    wait = _get_backoff(attempt, resp)
-                    await asyncio.sleep(wait)
+                request.extensions["timeout"] = httpx.Timeout(request_timeout).as_dict()
+                # Only in-flight attempts hold a slot; retries waiting out a
+                # backoff don't block fresh requests.
+                async with self._get_semaphore():
+                    resp = await self._client.send(request)
+
+                action = _classify(resp.status_code)
+                if action == "ok":
+                    return _loads(resp.content) if resp.content else {}
+
+                body = _error_body(resp)
+
+                if action == "retry" and attempt < self._max_retries:
+                    wait = _get_backoff(attempt, resp, max_delay=self._max_backoff)
+                    await asyncio.sleep(_clamp_wait(wait, self._max_backoff, deadline))
                     continue
 
                 _raise_for_status(resp.status_code, body)
 
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
+            except httpx.TransportError as e:
                 last_err = e
-                if attempt < self._max_retries:
-                    await asyncio.sleep(_BACKOFF_BASE[min(attempt, len(_BACKOFF_BASE) - 1)])
+                if attempt < self._max_retries and self._should_retry(e):
+                    await asyncio.sleep(_clamp_wait(_get_backoff(attempt), self._max_backoff, deadline))
                     continue
                 raise LeanvoxError(
-                    f"Connection failed after {self._max_retries + 1} attempts: {e}",
+                    f"Connection failed after {attempt + 1} attempts: {e}",
                     code="connection_error",
                 ) from e
 
@@ -237,7 +297,8 @@ class AsyncHTTPClient:
         async with self._client.stream(
             method,
             path,
-            json=json,
+            content=_dumps(json) if json is not None else None,
+            headers=_JSON_HEADERS if json is not None else None,
             timeout=_STREAM_TIMEOUT,
         ) as resp:
             yield resp
@@ -246,13 +307,138 @@ class AsyncHTTPClient:
         await self._client.aclose()
 
 
-def _get_backoff(attempt: int, resp: httpx.Response | None = None) -> float:
-    """Calculate backoff, respecting Retry-After header."""
+def _build_request(
+    client: httpx.Client | httpx.AsyncClient,
+    method: str,
+    path: str,
+    json: dict | None,
+    data: Any,
+    files: Any,
+    params: dict | None,
+) -> httpx.Request:
+    """Build a request for the multipart, JSON-body, or bare case."""
+    if files:
+        return client.build_request(method, path, params=params, files=files, data=data)
+    if json is not None:
+        return client.build_request(
+            method, path, params=params, content=_dumps(json), headers=_JSON_HEADERS,
+        )
+    return client.build_request(method, path, params=params)
+
+
+def _error_body(resp: httpx.Response) -> dict:
+    """Parse an error response, skipping JSON parsing for oversized bodies."""
+    if len(resp.content) <= _MAX_ERROR_BODY:
+        try:
+            body = _loads(resp.content)
+        except Exception:
+            pass
+        else:
+            if isinstance(body, dict):
+                return body
+    return {"error": {"message": resp.text[:_MAX_ERROR_MESSAGE]}}
+
+
+def _classify(status_code: int) -> str:
+    """Map a response status to "ok", "retry", or "fail"."""
+    if status_code < 400:
+        return "ok"
+    return _STATUS_ACTION.get(status_code, "fail")
+
+
+def _should_retry(exc: Exception) -> bool:
+    """Default policy for retrying a transport error."""
+    return isinstance(exc, _RETRY_EXCEPTIONS)
+
+
+def _get_backoff(
+    attempt: int,
+    resp: httpx.Response | None = None,
+    *,
+    max_delay: float = _DEFAULT_MAX_BACKOFF,
+) -> float:
+    """Calculate backoff, respecting Retry-After header.
+
+    Without Retry-After, the base schedule is spread with equal jitter
+    (50%-150% of the base) so concurrent clients don't retry in lockstep.
+    Retry-After may be delta-seconds or an HTTP-date and is clamped to
+    ``max_delay``.
+    """
     if resp is not None:
-        retry_after = resp.headers.get("Retry-After")
-        if retry_after:
-            try:
-                return float(retry_after)
-            except ValueError:
-                pass
-    return _BACKOFF_BASE[min(attempt, len(_BACKOFF_BASE) - 1)]
+        retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, max_delay)
+    base = _BACKOFF_BASE[min(attempt, len(_BACKOFF_BASE) - 1)]
+    return random.uniform(base * 0.5, base * 1.5)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value into seconds, or None if unusable."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "nan" and "inf" parse as floats but are not usable waits.
+        return max(seconds, 0.0) if math.isfinite(seconds) else None
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+# JSON encode/decode, bound once at import so the hot path calls orjson
+# directly when the extra is installed.
+if orjson is not None:
+    _dumps: Callable[[Any], bytes] = orjson.dumps
+    _loads: Callable[[bytes], Any] = orjson.loads
+else:  # pragma: no cover - depends on the orjson extra
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a request body to compact UTF-8 JSON bytes."""
+        return _json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    _loads = _json.loads
+
+
+def _deadline(total_timeout: float | None) -> float | None:
+    """Monotonic deadline for a request's retry budget, if one is set."""
+    if total_timeout is None:
+        return None
+    return time.monotonic() + total_timeout
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Seconds left before the deadline, raising once the budget is spent."""
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise _deadline_exceeded()
+    return left
+
+
+def _clamp_wait(wait: float, max_backoff: float, deadline: float | None) -> float:
+    """Cap a retry wait at max_backoff, raising if it would outlast the deadline.
+
+    Sleeping until the deadline would only lead to deadline_exceeded on the
+    next attempt, so that error is raised right away instead.
+    """
+    wait = min(wait, max_backoff)
+    left = _remaining(deadline)
+    if left is not None and wait >= left:
+        raise _deadline_exceeded()
+    return wait
+
+
+def _deadline_exceeded() -> LeanvoxError:
+    return LeanvoxError(
+        "Request deadline exceeded before a successful response",
+        code="deadline_exceeded",
+    )
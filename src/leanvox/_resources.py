@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
 import os
-from typing import Any, BinaryIO, List, Optional, Union
+import time
+from typing import Any, BinaryIO, Iterator, List, Optional, Union
 
-from .errors import LeanvoxError
+from .errors import InvalidRequestError, LeanvoxError
 from .types import (
     AccountBalance,
     AccountUsage,
+    AccountUsageTotals,
     FileExtractResult,
     Generation,
     GenerationList,
@@ -23,6 +26,12 @@ from .types import (
     Voice,
     VoiceDesign,
     VoiceList,
+    _ACCOUNT_BALANCE_FIELDS,
+    _FILE_EXTRACT_FIELDS,
+    _GENERATION_FIELDS,
+    _VOICE_DESIGN_FIELDS,
+    _VOICE_FIELDS,
+    _pick,
 )
 
 
@@ -95,13 +104,11 @@ class AudioResource:
 
     def _poll_transcription_job(self, job_id: str) -> "TranscribeResult":
         """Poll an async transcription job until completion."""
-        import time as _time
-
         poll_url = f"/v1/audio/transcriptions/{job_id}"
         max_attempts = 600  # 30 minutes at 3s intervals
 
         for _ in range(max_attempts):
-            _time.sleep(3)
+            time.sleep(3)
             job = self._http.request("GET", poll_url)
 
             status = job.get("status", "")
@@ -198,10 +205,15 @@ class VoicesResource:
         *,
         description: str = "",
         auto_unlock: bool = False,
+        send_base64: bool = False,
     ) -> Voice:
-        if isinstance(audio, str):
-            # base64 string
-            files = None
+        """Clone a voice from reference audio.
+
+        ``audio`` may be a file object or a base64 string. Base64 input is
+        decoded locally and uploaded as multipart like a file; pass
+        ``send_base64=True`` to send it in a JSON body instead.
+        """
+        if isinstance(audio, str) and send_base64:
             json_body = {
                 "name": name,
                 "audio_base64": audio,
@@ -209,13 +221,28 @@ class VoicesResource:
             }
             data = self._http.request("POST", "/v1/voices/clone", json=json_body)
         else:
-            files = {"audio": ("audio.wav", audio, "audio/wav")}
-            form_data = {"name": name, "description": description}
-            data = self._http.request(
-                "POST", "/v1/voices/clone", data=form_data, files=files
-            )
-
-        voice = Voice(**{k: v for k, v in data.items() if k in Voice.__dataclass_fields__})
+            if isinstance(audio, str):
+                # Accept data: URIs and line-wrapped base64, but nothing
+                # outside the alphabet (a file path is not base64).
+                if audio.startswith("data:"):
+                    audio = audio.partition(",")[2]
+                try:
+                    audio = base64.b64decode("".join(audio.split()), validate=True)  # type: ignore[assignment]
+                except binascii.Error as e:
+                    raise InvalidRequestError(
+                        "audio must be a file object or valid base64",
+                        code="invalid_request", status_code=400,
+                    ) from e
+            # Form fields ride along as filename-less parts so httpx encodes
+            # the whole multipart body from a single list.
+            files = [
+                ("audio", ("audio.wav", audio, "audio/wav")),
+                ("name", (None, name)),
+                ("description", (None, description)),
+            ]
+            data = self._http.request("POST", "/v1/voices/clone", files=files)
+
+        voice = Voice(**_pick(data, _VOICE_FIELDS))
 
         if auto_unlock and voice.status == "pending_unlock":
             self.unlock(voice.voice_id)
@@ -240,7 +267,7 @@ class VoicesResource:
         if description:
             body["description"] = description
         data = self._http.request("POST", "/v1/voices/design", json=body)
-        return VoiceDesign(**{k: v for k, v in data.items() if k in VoiceDesign.__dataclass_fields__})
+        return VoiceDesign(**_pick(data, _VOICE_DESIGN_FIELDS))
 
     def list_designs(self) -> List[VoiceDesign]:
         data = self._http.request("GET", "/v1/voices/designs")
@@ -259,7 +286,7 @@ class FilesResource:
     def extract_text(self, file: BinaryIO) -> FileExtractResult:
         files = {"file": (getattr(file, "name", "upload"), file)}
         data = self._http.request("POST", "/v1/files/extract-text", files=files)
-        return FileExtractResult(**{k: v for k, v in data.items() if k in FileExtractResult.__dataclass_fields__})
+        return FileExtractResult(**_pick(data, _FILE_EXTRACT_FIELDS))
 
 
 class GenerationsResource:
@@ -277,9 +304,30 @@ class GenerationsResource:
             total=data.get("total", 0),
         )
 
+    def iter_all(self, *, page_size: int = 100) -> Iterator[Generation]:
+        """Iterate over the full generation history one page at a time.
+
+        Only a single page of results is held in memory, so large histories
+        can be walked without materializing them as one list.
+        """
+        offset = 0
+        while True:
+            page = self.list(limit=page_size, offset=offset)
+            yield from page.generations
+            offset += len(page.generations)
+            if not page.generations:
+                return
+            # Trust total when the server reports it; the server may clamp
+            # page_size, so a short page alone does not mean the end.
+            if page.total:
+                if offset >= page.total:
+                    return
+            elif len(page.generations) < page_size:
+                return
+
     def get_audio(self, generation_id: str) -> Generation:
         data = self._http.request("GET", f"/v1/generations/{generation_id}/audio")
-        return Generation(**{k: v for k, v in data.items() if k in Generation.__dataclass_fields__})
+        return Generation(**_pick(data, _GENERATION_FIELDS))
 
     def delete(self, generation_id: str) -> None:
         self._http.request("DELETE", f"/v1/generations/{generation_id}")
@@ -293,7 +341,7 @@ class AccountResource:
 
     def balance(self) -> AccountBalance:
         data = self._http.request("GET", "/v1/account/balance")
-        return AccountBalance(**{k: v for k, v in data.items() if k in AccountBalance.__dataclass_fields__})
+        return AccountBalance(**_pick(data, _ACCOUNT_BALANCE_FIELDS))
 
     def usage(
         self, *, days: int = 30, model: str | None = None, limit: int = 100
@@ -304,6 +352,29 @@ class AccountResource:
         data = self._http.request("GET", "/v1/account/usage", params=params)
         return AccountUsage(entries=data.get("entries", []))
 
+    def usage_totals(
+        self, *, days: int = 30, model: str | None = None, limit: int = 100
+    ) -> AccountUsageTotals:
+        """Sum characters and cost, overall and per model, of one usage() page.
+
+        Only the entries that usage() returns are counted, at most ``limit``
+        of them; raise ``limit`` to cover a longer history.
+        """
+        entries = self.usage(days=days, model=model, limit=limit).entries
+        totals = AccountUsageTotals()
+        for entry in entries:
+            chars = entry.get("characters", 0)
+            cost = entry.get("cost_cents", 0)
+            totals.characters += chars
+            totals.cost_cents += cost
+            name = entry.get("model", "unknown")
+            per_model = totals.by_model.get(name)
+            if per_model is None:
+                per_model = totals.by_model[name] = AccountUsageTotals()
+            per_model.characters += chars
+            per_model.cost_cents += cost
+        return totals
+
     def buy_credits(self, amount_cents: int) -> dict:
         data = self._http.request(
             "POST", "/v1/billing/checkout", json={"amount_cents": amount_cents}
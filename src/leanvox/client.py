@@ -2,24 +2,106 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import contextmanager
+from functools import cached_property
+from operator import itemgetter
 import os
-from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+import random
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
 
 from ._auth import ensure_api_key, resolve_api_key
 from ._http import HTTPClient, AsyncHTTPClient
 from ._resources import AccountResource, AudioResource, FilesResource, GenerationsResource, VoicesResource
-from .errors import InvalidRequestError, StreamingFormatError
-from .types import GenerateResult, Job, VoiceOverResult
+from .errors import InvalidRequestError, LeanvoxError, NotFoundError, StreamingFormatError
+from .types import _DEFAULT_STREAM_CHUNK, GenerateResult, Job, VoiceOverResult
 
 
 _DEFAULT_BASE_URL = "https://api.leanvox.com"
 _DEFAULT_TIMEOUT = 30.0
 _DEFAULT_MAX_RETRIES = 2
+_DEFAULT_MAX_BACKOFF = 30.0
+_DEFAULT_MAX_CONCURRENCY = 32
 _DEFAULT_AUTO_ASYNC_THRESHOLD = 5000
+_DEFAULT_BATCH_CONCURRENCY = 16
+
+# Process-wide HTTPClients shared by Leanvox instances with identical
+# settings, so clients created per request reuse warm connections. Each
+# entry holds the client and the number of Leanvox instances using it.
+# AsyncLeanvox is not pooled: async connections belong to one event loop.
+_HTTP_POOL: dict[tuple, list[Any]] = {}
+_HTTP_POOL_LOCK = threading.Lock()
+
+# Job polling backoff for auto-async generate(): 0.25s, 0.5s, 1s, ... up to 30s
+_POLL_INITIAL = 0.25
+_POLL_FACTOR = 2.0
+_POLL_MAX = 30.0
+# Server-side wait for job long-polling, and the minimum time a supporting
+# server holds the request before answering with a still-running job.
+_LONG_POLL_WAIT = 30.0
+_LONG_POLL_MIN_HOLD = 1.0
+# Headroom left between the long-poll wait and a client's total_timeout.
+_LONG_POLL_MARGIN = 5.0
+# Errors from a long-poll that outlived a client timeout; the job is
+# still pending, so waiting falls back to plain polling.
+_LONG_POLL_TIMEOUT_CODES = ("connection_error", "deadline_exceeded")
+# Overall budget for waiting on an async job, in generate() and wait_many().
+_MAX_JOB_WAIT = 30 * 60.0
+
+
+class _GenerateMixin:
+    """Request validation, body building and job polling shared by both clients."""
+
+    _timeout: float
+    _total_timeout: float | None
+
+    @staticmethod
+    def _prepare_generate(
+        text: str,
+        model: str,
+        voice: str,
+        language: str,
+        format: str,
+        speed: float,
+        exaggeration: float,
+        *,
+        voice_instructions: str = "",
+        text_len: int | None = None,
+    ) -> dict:
+        """Validate generate() arguments and return the request body."""
+        _validate_generate_params(
+            text, model, speed, exaggeration,
+            voice_instructions=voice_instructions, text_len=text_len,
+        )
+        return _build_generate_body(
+            text, model, voice, language, format, speed, exaggeration,
+            voice_instructions=voice_instructions,
+        )
 
+    @staticmethod
+    def _prepare_dialogue(lines: List[Dict[str, Any]], model: str, gap_ms: int) -> dict:
+        """Validate dialogue() arguments and return the request body."""
+        if len(lines) < 2:
+            raise InvalidRequestError(
+                "Dialogue requires at least 2 lines",
+                code="invalid_request", status_code=400,
+            )
+        return {"model": model, "lines": lines, "gap_ms": gap_ms}
+
+    def _long_poll_wait(self) -> float:
+        """Server-side wait for job long-polls, kept inside total_timeout."""
+        if self._total_timeout is None:
+            return _LONG_POLL_WAIT
+        return min(_LONG_POLL_WAIT, self._total_timeout - _LONG_POLL_MARGIN)
+
+    def _long_poll_params(self, wait: float) -> Dict[str, Any]:
+        """Request arguments for a job long-poll holding up to wait seconds."""
+        return {"params": {"wait": int(wait)}, "timeout": wait + self._timeout}
 
-class Leanvox:
+
+class Leanvox(_GenerateMixin):
     """Sync Leanvox client.
 
     Usage:
@@ -35,63 +117,79 @@ class Leanvox:
         timeout: float = _DEFAULT_TIMEOUT,
         max_retries: int = _DEFAULT_MAX_RETRIES,
         auto_async_threshold: int = _DEFAULT_AUTO_ASYNC_THRESHOLD,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        total_timeout: float | None = None,
+        should_retry: Callable[[Exception], bool] | None = None,
     ) -> None:
         self._api_key = resolve_api_key(api_key)
         self._base_url = base_url
         self._timeout = timeout
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._total_timeout = total_timeout
+        self._should_retry = should_retry
         self._auto_async_threshold = auto_async_threshold
         self._http: HTTPClient | None = None
-
-        # Sub-resources (lazy init with HTTP client)
-        self._audio: AudioResource | None = None
-        self._voices: VoicesResource | None = None
-        self._files: FilesResource | None = None
-        self._generations: GenerationsResource | None = None
-        self._account: AccountResource | None = None
+        self._http_key: tuple = ()
 
     def _get_http(self) -> HTTPClient:
         if self._http is None:
             key = ensure_api_key(self._api_key)
-            self._http = HTTPClient(
-                base_url=self._base_url,
-                api_key=key,
-                timeout=self._timeout,
-                max_retries=self._max_retries,
+            pool_key = (
+                self._base_url, key, self._timeout, self._max_retries,
+                self._max_backoff, self._total_timeout, self._should_retry,
             )
+            with _HTTP_POOL_LOCK:
+                entry = _HTTP_POOL.get(pool_key)
+                if entry is None:
+                    http = HTTPClient(
+                        base_url=self._base_url,
+                        api_key=key,
+                        timeout=self._timeout,
+                        max_retries=self._max_retries,
+                        max_backoff=self._max_backoff,
+                        total_timeout=self._total_timeout,
+                        should_retry=self._should_retry,
+                    )
+                    entry = _HTTP_POOL[pool_key] = [http, 0]
+                entry[1] += 1
+            self._http = entry[0]
+            self._http_key = pool_key
         return self._http
 
-    @property
-    @property
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Close every pooled HTTP client, including ones still referenced."""
+        with _HTTP_POOL_LOCK:
+            entries = list(_HTTP_POOL.values())
+            _HTTP_POOL.clear()
+        for http, _ in entries:
+            http.close()
+
+    # Sub-resources are built on first access (which also creates the HTTP
+    # client) and then cached on the instance until close().
+    _RESOURCES = ("audio", "voices", "files", "generations", "account")
+
+    @cached_property
     def audio(self) -> AudioResource:
         """Audio intelligence (transcription, diarization, summarization)."""
-        if self._audio is None:
-            self._audio = AudioResource(self._get_http())
-        return self._audio
+        return AudioResource(self._get_http())
 
-    @property
+    @cached_property
     def voices(self) -> VoicesResource:
-        if self._voices is None:
-            self._voices = VoicesResource(self._get_http())
-        return self._voices
+        return VoicesResource(self._get_http())
 
-    @property
+    @cached_property
     def files(self) -> FilesResource:
-        if self._files is None:
-            self._files = FilesResource(self._get_http())
-        return self._files
+        return FilesResource(self._get_http())
 
-    @property
+    @cached_property
     def generations(self) -> GenerationsResource:
-        if self._generations is None:
-            self._generations = GenerationsResource(self._get_http())
-        return self._generations
+        return GenerationsResource(self._get_http())
 
-    @property
+    @cached_property
     def account(self) -> AccountResource:
-        if self._account is None:
-            self._account = AccountResource(self._get_http())
-        return self._account
+        return AccountResource(self._get_http())
 
     def generate(
         self,
@@ -111,19 +209,17 @@ class Leanvox:
             client.generate("Hello", model="max",
                 voice_instructions="A warm, confident female narrator")
         """
-        _validate_generate_params(text, model, speed, exaggeration, voice_instructions=voice_instructions)
+        text_len = len(text)
+        body = self._prepare_generate(
+            text, model, voice, language, format, speed, exaggeration,
+            voice_instructions=voice_instructions, text_len=text_len,
+        )
+        http = self._get_http()
 
         # Auto-route to async if text exceeds threshold
-        if len(text) > self._auto_async_threshold:
-            job = self.generate_async(
-                text=text, model=model, voice=voice, voice_instructions=voice_instructions,
-                language=language, format=format, speed=speed, exaggeration=exaggeration,
-            )
-            # Poll until complete
-            import time
-            while job.status not in ("completed", "failed"):
-                time.sleep(2)
-                job = self.get_job(job.id)
+        if text_len > self._auto_async_threshold:
+            data = http.request("POST", "/v1/tts/generate/async", json=body)
+            job = self._wait_for_job(_submitted_job_from_dict(data))
             if job.status == "failed":
                 raise InvalidRequestError(
                     job.error or "Async generation failed",
@@ -131,22 +227,12 @@ class Leanvox:
                 )
             return GenerateResult(
                 audio_url=job.audio_url, model=model, voice=voice,
-                characters=len(text), cost_cents=0,
-                _http_client=self._get_http().raw_client,
+                characters=text_len, cost_cents=0,
+                _http_client=http.raw_client,
             )
 
-        body = _build_generate_body(text, model, voice, language, format, speed, exaggeration, voice_instructions=voice_instructions)
-        data = self._get_http().request("POST", "/v1/tts/generate", json=body)
-        return GenerateResult(
-            audio_url=data.get("audio_url", ""),
-            model=data.get("model", model),
-            voice=data.get("voice", voice),
-            characters=data.get("characters", 0),
-            cost_cents=data.get("cost_cents", 0),
-            generated_voice_id=data.get("generated_voice_id"),
-            suggestion=data.get("suggestion"),
-            _http_client=self._get_http().raw_client,
-        )
+        data = http.request("POST", "/v1/tts/generate", json=body)
+        return _generate_result_from_dict(data, model, voice, http.raw_client)
 
     @contextmanager
     def stream(
@@ -160,20 +246,28 @@ class Leanvox:
         speed: float = 1.0,
         exaggeration: float = 0.5,
         format: str = "mp3",
+        chunk_size: int = _DEFAULT_STREAM_CHUNK,
     ) -> Iterator[Iterator[bytes]]:
-        """Stream audio as byte chunks. Always MP3."""
+        """Stream audio as byte chunks. Always MP3.
+
+        chunk_size defaults to 64 KB, which keeps per-chunk overhead low for
+        downloads. Larger chunks delay the first chunk, so live playback may
+        want a smaller size.
+        """
         if format.lower() != "mp3":
             raise StreamingFormatError(
                 "Streaming only supports MP3 format. "
                 f"Got format='{format}'. Use generate() for other formats.",
                 code="streaming_format_error", status_code=400,
             )
-        _validate_generate_params(text, model, speed, exaggeration, voice_instructions=voice_instructions)
-        body = _build_generate_body(text, model, voice, language, "mp3", speed, exaggeration, voice_instructions=voice_instructions)
+        body = self._prepare_generate(
+            text, model, voice, language, "mp3", speed, exaggeration,
+            voice_instructions=voice_instructions,
+        )
 
         with self._get_http().stream("POST", "/v1/tts/stream", json=body) as resp:
             resp.raise_for_status()
-            yield resp.iter_bytes(chunk_size=4096)
+            yield resp.iter_bytes(chunk_size=chunk_size)
 
     def dialogue(
         self,
@@ -190,21 +284,10 @@ class Leanvox:
                 {"text": "Hi there!", "voice_instructions": "Deep male host"},
             ]
         """
-        if len(lines) < 2:
-            raise InvalidRequestError(
-                "Dialogue requires at least 2 lines",
-                code="invalid_request", status_code=400,
-            )
-        body = {"model": model, "lines": lines, "gap_ms": gap_ms}
-        data = self._get_http().request("POST", "/v1/tts/dialogue", json=body)
-        return GenerateResult(
-            audio_url=data.get("audio_url", ""),
-            model=data.get("model", model),
-            voice="dialogue",
-            characters=data.get("characters", 0),
-            cost_cents=data.get("cost_cents", 0),
-            _http_client=self._get_http().raw_client,
-        )
+        body = self._prepare_dialogue(lines, model, gap_ms)
+        http = self._get_http()
+        data = http.request("POST", "/v1/tts/dialogue", json=body)
+        return _dialogue_result_from_dict(data, model, http.raw_client)
 
     def voiceover(
         self,
@@ -298,40 +381,92 @@ class Leanvox:
         webhook_url: str = "",
     ) -> Job:
         """Submit async generation job."""
-        _validate_generate_params(text, model, speed, exaggeration, voice_instructions=voice_instructions)
-        body = _build_generate_body(text, model, voice, language, format, speed, exaggeration, voice_instructions=voice_instructions)
+        body = self._prepare_generate(
+            text, model, voice, language, format, speed, exaggeration,
+            voice_instructions=voice_instructions,
+        )
         if webhook_url:
             body["webhook_url"] = webhook_url
         data = self._get_http().request("POST", "/v1/tts/generate/async", json=body)
-        return Job(
-            id=data.get("job_id", data.get("id", "")),
-            status=data.get("status", "pending"),
-            estimated_seconds=data.get("estimated_seconds", 0),
-        )
+        return _submitted_job_from_dict(data)
 
     def get_job(self, job_id: str) -> Job:
         """Get async job status."""
         data = self._get_http().request("GET", f"/v1/tts/jobs/{job_id}")
-        mapped = {**data}
-        if "job_id" in mapped and "id" not in mapped:
-            mapped["id"] = mapped.pop("job_id")
-        return Job(**{k: v for k, v in mapped.items() if k in Job.__dataclass_fields__})
+        return _job_from_dict(data)
+
+    def _long_poll_job(self, job_id: str, wait: float = _LONG_POLL_WAIT) -> Job:
+        """Get job status, letting the server hold the request up to wait seconds."""
+        data = self._get_http().request(
+            "GET", f"/v1/tts/jobs/{job_id}", **self._long_poll_params(wait),
+        )
+        return _job_from_dict(data)
+
+    def _wait_for_job(self, job: Job) -> Job:
+        """Block until a job completes or fails.
+
+        Long-polls first so the server reports completion in a single round
+        trip. If the server rejects or ignores ``wait``, or the long-poll
+        times out, falls back to polling get_job with exponential backoff
+        and jitter. Non-terminal replies are spaced by the same backoff, and
+        waiting gives up with a ``job_timeout`` error after
+        ``_MAX_JOB_WAIT`` seconds.
+        """
+        deadline = time.monotonic() + _MAX_JOB_WAIT
+        wait = self._long_poll_wait()
+        long_poll = wait >= 2 * _LONG_POLL_MIN_HOLD
+        delay = _POLL_INITIAL
+        while job.status not in ("completed", "failed"):
+            if time.monotonic() >= deadline:
+                raise _job_timeout(job.id)
+            if long_poll:
+                started = time.monotonic()
+                try:
+                    job = self._long_poll_job(job.id, wait)
+                except (InvalidRequestError, NotFoundError):
+                    long_poll = False
+                    continue
+                except LeanvoxError as e:
+                    if e.code not in _LONG_POLL_TIMEOUT_CODES:
+                        raise
+                    long_poll = False
+                    continue
+                held = time.monotonic() - started
+                # An immediate non-terminal answer means wait was ignored.
+                if held < _LONG_POLL_MIN_HOLD:
+                    long_poll = False
+                    continue
+                # A slow server that ignores wait still gets backoff.
+                if held < delay and job.status not in ("completed", "failed"):
+                    time.sleep(delay - held)
+                delay = min(delay * _POLL_FACTOR, _POLL_MAX)
+                continue
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            job = self.get_job(job.id)
+            delay = min(delay * _POLL_FACTOR, _POLL_MAX)
+        return job
 
     def list_jobs(self) -> List[Job]:
         """List all async jobs."""
         data = self._get_http().request("GET", "/v1/tts/jobs")
-        jobs = []
-        for j in data.get("jobs", []):
-            mapped = {**j}
-            if "job_id" in mapped and "id" not in mapped:
-                mapped["id"] = mapped.pop("job_id")
-            jobs.append(Job(**{k: v for k, v in mapped.items() if k in Job.__dataclass_fields__}))
-        return jobs
+        return list(map(_job_from_dict, data.get("jobs", ())))
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if self._http:
-            self._http.close()
+        """Release the pooled HTTP client, closing it once no client uses it."""
+        if self._http is None:
+            return
+        http, self._http = self._http, None
+        # Cached resources hold the released client; rebuild them on next use.
+        for name in self._RESOURCES:
+            self.__dict__.pop(name, None)
+        with _HTTP_POOL_LOCK:
+            entry = _HTTP_POOL.get(self._http_key)
+            if entry is not None and entry[0] is http:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _HTTP_POOL[self._http_key]
+        http.close()
 
     def __enter__(self):
         return self
@@ -340,7 +475,7 @@ class Leanvox:
         self.close()
 
 
-class AsyncLeanvox:
+class AsyncLeanvox(_GenerateMixin):
     """Async Leanvox client.
 
     Usage:
@@ -356,11 +491,21 @@ class AsyncLeanvox:
         timeout: float = _DEFAULT_TIMEOUT,
         max_retries: int = _DEFAULT_MAX_RETRIES,
         auto_async_threshold: int = _DEFAULT_AUTO_ASYNC_THRESHOLD,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        total_timeout: float | None = None,
+        should_retry: Callable[[Exception], bool] | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        warmup: bool = False,
     ) -> None:
         self._api_key = resolve_api_key(api_key)
         self._base_url = base_url
         self._timeout = timeout
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._total_timeout = total_timeout
+        self._should_retry = should_retry
+        self._max_concurrency = max_concurrency
+        self._warmup = warmup
         self._auto_async_threshold = auto_async_threshold
         self._http: AsyncHTTPClient | None = None
 
@@ -372,6 +517,10 @@ class AsyncLeanvox:
                 api_key=key,
                 timeout=self._timeout,
                 max_retries=self._max_retries,
+                max_backoff=self._max_backoff,
+                total_timeout=self._total_timeout,
+                should_retry=self._should_retry,
+                max_concurrency=self._max_concurrency,
             )
         return self._http
 
@@ -388,18 +537,12 @@ class AsyncLeanvox:
         exaggeration: float = 0.5,
     ) -> GenerateResult:
         """Generate speech from text (async)."""
-        _validate_generate_params(text, model, speed, exaggeration, voice_instructions=voice_instructions)
-        body = _build_generate_body(text, model, voice, language, format, speed, exaggeration, voice_instructions=voice_instructions)
-        data = await self._get_http().request("POST", "/v1/tts/generate", json=body)
-        return GenerateResult(
-            audio_url=data.get("audio_url", ""),
-            model=data.get("model", model),
-            voice=data.get("voice", voice),
-            characters=data.get("characters", 0),
-            cost_cents=data.get("cost_cents", 0),
-            generated_voice_id=data.get("generated_voice_id"),
-            suggestion=data.get("suggestion"),
+        body = self._prepare_generate(
+            text, model, voice, language, format, speed, exaggeration,
+            voice_instructions=voice_instructions,
         )
+        data = await self._get_http().request("POST", "/v1/tts/generate", json=body)
+        return _generate_result_from_dict(data, model, voice)
 
     async def dialogue(
         self,
@@ -409,20 +552,9 @@ class AsyncLeanvox:
         gap_ms: int = 500,
     ) -> GenerateResult:
         """Generate multi-speaker dialogue (async)."""
-        if len(lines) < 2:
-            raise InvalidRequestError(
-                "Dialogue requires at least 2 lines",
-                code="invalid_request", status_code=400,
-            )
-        body = {"model": model, "lines": lines, "gap_ms": gap_ms}
+        body = self._prepare_dialogue(lines, model, gap_ms)
         data = await self._get_http().request("POST", "/v1/tts/dialogue", json=body)
-        return GenerateResult(
-            audio_url=data.get("audio_url", ""),
-            model=data.get("model", model),
-            voice="dialogue",
-            characters=data.get("characters", 0),
-            cost_cents=data.get("cost_cents", 0),
-        )
+        return _dialogue_result_from_dict(data, model)
 
     async def generate_async(
         self,
@@ -437,99 +569,276 @@ class AsyncLeanvox:
         webhook_url: str = "",
     ) -> Job:
         """Submit async generation job."""
-        _validate_generate_params(text, model, speed, exaggeration)
-        body = _build_generate_body(text, model, voice, language, format, speed, exaggeration)
+        body = self._prepare_generate(text, model, voice, language, format, speed, exaggeration)
         if webhook_url:
             body["webhook_url"] = webhook_url
         data = await self._get_http().request("POST", "/v1/tts/generate/async", json=body)
-        return Job(
-            id=data.get("job_id", data.get("id", "")),
-            status=data.get("status", "pending"),
-            estimated_seconds=data.get("estimated_seconds", 0),
-        )
+        return _submitted_job_from_dict(data)
 
     async def get_job(self, job_id: str) -> Job:
         data = await self._get_http().request("GET", f"/v1/tts/jobs/{job_id}")
-        mapped = {**data}
-        if "job_id" in mapped and "id" not in mapped:
-            mapped["id"] = mapped.pop("job_id")
-        return Job(**{k: v for k, v in mapped.items() if k in Job.__dataclass_fields__})
+        return _job_from_dict(data)
 
     async def list_jobs(self) -> List[Job]:
         data = await self._get_http().request("GET", "/v1/tts/jobs")
-        jobs = []
-        for j in data.get("jobs", []):
-            mapped = {**j}
-            if "job_id" in mapped and "id" not in mapped:
-                mapped["id"] = mapped.pop("job_id")
-            jobs.append(Job(**{k: v for k, v in mapped.items() if k in Job.__dataclass_fields__}))
-        return jobs
+        return list(map(_job_from_dict, data.get("jobs", ())))
+
+    async def generate_many(
+        self,
+        texts: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[GenerateResult]:
+        """Generate speech for many texts concurrently (async).
+
+        Runs at most ``concurrency`` requests at once and returns results in
+        the order of ``texts``. Keyword arguments are passed to generate().
+        The first failure is raised once all requests have finished.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(text: str) -> GenerateResult:
+            async with sem:
+                return await self.generate(text, **kwargs)
+
+        return await _gather(one(t) for t in texts)
+
+    async def wait_many(
+        self,
+        job_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Job]:
+        """Poll many async jobs until each completes or fails.
+
+        Returns the final Job for each ID, in the order of ``job_ids``.
+        Each job is long-polled like generate() waits on one, and raises a
+        ``job_timeout`` error if it does not finish within 30 minutes.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        return await _gather(self._wait_for_job(j, sem) for j in job_ids)
+
+    async def _long_poll_job(self, job_id: str, wait: float = _LONG_POLL_WAIT) -> Job:
+        """Get job status, letting the server hold the request up to wait seconds."""
+        data = await self._get_http().request(
+            "GET", f"/v1/tts/jobs/{job_id}", **self._long_poll_params(wait),
+        )
+        return _job_from_dict(data)
+
+    async def _wait_for_job(self, job_id: str, sem: asyncio.Semaphore) -> Job:
+        """Wait for one job like Leanvox._wait_for_job, holding sem per request."""
+        deadline = time.monotonic() + _MAX_JOB_WAIT
+        wait = self._long_poll_wait()
+        long_poll = wait >= 2 * _LONG_POLL_MIN_HOLD
+        delay = _POLL_INITIAL
+        while True:
+            if time.monotonic() >= deadline:
+                raise _job_timeout(job_id)
+            if long_poll:
+                started = time.monotonic()
+                try:
+                    async with sem:
+                        job = await self._long_poll_job(job_id, wait)
+                except (InvalidRequestError, NotFoundError):
+                    long_poll = False
+                    continue
+                except LeanvoxError as e:
+                    if e.code not in _LONG_POLL_TIMEOUT_CODES:
+                        raise
+                    long_poll = False
+                    continue
+                if job.status in ("completed", "failed"):
+                    return job
+                held = time.monotonic() - started
+                # An immediate non-terminal answer means wait was ignored.
+                if held < _LONG_POLL_MIN_HOLD:
+                    long_poll = False
+                    continue
+                # A slow server that ignores wait still gets backoff.
+                if held < delay:
+                    await asyncio.sleep(delay - held)
+                delay = min(delay * _POLL_FACTOR, _POLL_MAX)
+                continue
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            async with sem:
+                job = await self.get_job(job_id)
+            if job.status in ("completed", "failed"):
+                return job
+            delay = min(delay * _POLL_FACTOR, _POLL_MAX)
 
     async def close(self) -> None:
         if self._http:
             await self._http.close()
 
     async def __aenter__(self):
+        if self._warmup:
+            await self._get_http().warmup()
         return self
 
     async def __aexit__(self, *args):
         await self.close()
 
 
+# --- Response helpers ---
+
+async def _gather(coros: Iterable[Any]) -> List[Any]:
+    """Await coroutines concurrently, raising the first error after all finish."""
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _fields_getter(*fields: str) -> Callable[[dict, tuple], tuple]:
+    """Build a reader returning ``fields`` from a response dict as a tuple.
+
+    The common case, where the server sent every field, is a single
+    itemgetter call. Missing fields fall back to the matching entry in
+    ``defaults``.
+    """
+    getter = itemgetter(*fields)
+
+    def get(data: dict, defaults: tuple) -> tuple:
+        try:
+            return getter(data)
+        except KeyError:
+            return tuple(map(data.get, fields, defaults))
+
+    return get
+
+
+_GENERATE_RESULT_FIELDS = _fields_getter("audio_url", "model", "voice", "characters", "cost_cents")
+_DIALOGUE_RESULT_FIELDS = _fields_getter("audio_url", "model", "characters", "cost_cents")
+_SUBMITTED_JOB_FIELDS = _fields_getter("job_id", "status", "estimated_seconds")
+
+
+def _generate_result_from_dict(
+    data: dict, model: str, voice: str, http_client: Any = None,
+) -> GenerateResult:
+    audio_url, model, voice, characters, cost_cents = _GENERATE_RESULT_FIELDS(
+        data, ("", model, voice, 0, 0),
+    )
+    return GenerateResult(
+        audio_url, model, voice, characters, cost_cents,
+        data.get("generated_voice_id"), data.get("suggestion"),
+        _http_client=http_client,
+    )
+
+
+def _dialogue_result_from_dict(data: dict, model: str, http_client: Any = None) -> GenerateResult:
+    audio_url, model, characters, cost_cents = _DIALOGUE_RESULT_FIELDS(data, ("", model, 0, 0))
+    return GenerateResult(audio_url, model, "dialogue", characters, cost_cents, _http_client=http_client)
+
+
+def _submitted_job_from_dict(data: dict) -> Job:
+    job_id, status, estimated_seconds = _SUBMITTED_JOB_FIELDS(
+        data, (data.get("id", ""), "pending", 0),
+    )
+    return Job(job_id, status, estimated_seconds)
+
+
+def _job_timeout(job_id: str) -> LeanvoxError:
+    return LeanvoxError(
+        f"Job {job_id} did not finish within {_MAX_JOB_WAIT:.0f} seconds",
+        code="job_timeout",
+    )
+
+
+def _job_from_dict(data: dict) -> Job:
+    get = data.get
+    return Job(
+        data["id"] if "id" in data else get("job_id", ""),
+        get("status", "pending"),
+        get("estimated_seconds", 0),
+        get("audio_url", ""),
+        get("error", ""),
+    )
+
+
 # --- Validation helpers ---
 
+_VALID_MODELS = frozenset({"standard", "pro", "max"})
+_MAX_TEXT_LENGTH = 10_000
+_MAX_VOICE_INSTRUCTIONS = 300
+# Range bounds are plain floats so each check is one chained comparison.
+# A chained comparison also rejects NaN, which an arithmetic form
+# such as (speed - lo) * (hi - speed) < 0 would let through.
+_MIN_SPEED, _MAX_SPEED = 0.5, 2.0
+_MIN_EXAGGERATION, _MAX_EXAGGERATION = 0.0, 1.0
+_DEFAULT_EXAGGERATION = 0.5
+
+
 def _validate_generate_params(
     text: str, model: str, speed: float, exaggeration: float,
-    *, voice_instructions: str = "",
+    *, voice_instructions: str = "", text_len: int | None = None,
 ) -> None:
+    """Validate generate() arguments.
+
+    Callers that already know len(text) pass it as text_len to skip
+    recomputing it.
+    """
+    if text_len is None:
+        text_len = len(text)
     if not text:
         raise InvalidRequestError(
             "Text cannot be empty", code="invalid_request", status_code=400
         )
-    if len(text) > 10_000:
+    if text_len > _MAX_TEXT_LENGTH:
         raise InvalidRequestError(
-            f"Text exceeds maximum of 10,000 characters (got {len(text)})",
+            f"Text exceeds maximum of 10,000 characters (got {text_len})",
             code="invalid_request", status_code=400,
         )
-    if model not in ("standard", "pro", "max"):
+    if model not in _VALID_MODELS:
         raise InvalidRequestError(
             f"Model must be 'standard', 'pro', or 'max', got '{model}'",
             code="invalid_request", status_code=400,
         )
-    if model == "max" and not voice_instructions:
-        raise InvalidRequestError(
-            "voice_instructions is required when model is 'max'. "
-            'Example: voice_instructions="A warm, confident female narrator"',
-            code="invalid_request", status_code=400,
-        )
-    if model == "max" and len(voice_instructions) > 300:
-        raise InvalidRequestError(
-            f"voice_instructions must be 300 characters or less (got {len(voice_instructions)})",
-            code="invalid_request", status_code=400,
-        )
-    if model != "max" and voice_instructions:
+    if model == "max":
+        if not voice_instructions:
+            raise InvalidRequestError(
+                "voice_instructions is required when model is 'max'. "
+                'Example: voice_instructions="A warm, confident female narrator"',
+                code="invalid_request", status_code=400,
+            )
+        if len(voice_instructions) > _MAX_VOICE_INSTRUCTIONS:
+            raise InvalidRequestError(
+                f"voice_instructions must be 300 characters or less (got {len(voice_instructions)})",
+                code="invalid_request", status_code=400,
+            )
+    elif voice_instructions:
         raise InvalidRequestError(
             f"voice_instructions is only supported with model='max', not '{model}'",
             code="invalid_request", status_code=400,
         )
-    if not (0.5 <= speed <= 2.0):
+    if not (_MIN_SPEED <= speed <= _MAX_SPEED):
         raise InvalidRequestError(
             f"Speed must be between 0.5 and 2.0, got {speed}",
             code="invalid_request", status_code=400,
         )
-    if model == "standard" and exaggeration != 0.5:
-        raise InvalidRequestError(
-            "exaggeration is only supported on the 'pro' model. "
-            "Use model='pro' or remove the exaggeration parameter.",
-            code="invalid_request", status_code=400,
-        )
-    if not (0.0 <= exaggeration <= 1.0):
-        raise InvalidRequestError(
-            f"Exaggeration must be between 0.0 and 1.0, got {exaggeration}",
-            code="invalid_request", status_code=400,
-        )
+    # The default exaggeration is valid for every model; only check others.
+    if exaggeration != _DEFAULT_EXAGGERATION:
+        if model == "standard":
+            raise InvalidRequestError(
+                "exaggeration is only supported on the 'pro' model. "
+                "Use model='pro' or remove the exaggeration parameter.",
+                code="invalid_request", status_code=400,
+            )
+        if not (_MIN_EXAGGERATION <= exaggeration <= _MAX_EXAGGERATION):
+            raise InvalidRequestError(
+                f"Exaggeration must be between 0.0 and 1.0, got {exaggeration}",
+                code="invalid_request", status_code=400,
+            )
+
+
+# Body for the library defaults (standard model, no voice, English, MP3).
+# _build_generate_body copies it and fills in text and speed. Never mutate.
+_DEFAULT_BODY_TEMPLATE = {"text": "", "model": "standard", "language": "en", "format": "mp3", "speed": 1.0}
 
 
+# Deliberately uncached: building this small dict is cheaper than an LRU
+# lookup keyed on the text plus the copy callers would need to mutate it.
 def _build_generate_body(
     text: str,
     model: str,
@@ -541,7 +850,12 @@ def _build_generate_body(
     *,
     voice_instructions: str = "",
 ) -> dict:
-    body: dict = {"text": text, "model": model, "language": language, "format": format, "speed": speed}
+    if model == "standard" and not voice and language == "en" and format == "mp3":
+        body = _DEFAULT_BODY_TEMPLATE.copy()
+        body["text"] = text
+        body["speed"] = speed
+        return body
+    body = {"text": text, "model": model, "language": language, "format": format, "speed": speed}
     if model == "max":
         body["voice_instructions"] = voice_instructions
     elif voice:
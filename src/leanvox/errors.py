@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Callable
+
 
 class LeanvoxError(Exception):
     """Base error for all Leanvox API errors."""
@@ -72,6 +74,13 @@ _ERROR_MAP: dict[int, type[LeanvoxError]] = {
     500: ServerError,
 }
 
+# Extra constructor kwargs for error classes that carry more than the base
+# fields, read from the response's error object.
+_EXTRA_KWARGS: dict[type[LeanvoxError], Callable[[dict], dict]] = {
+    InsufficientBalanceError: lambda d: {"balance_cents": d.get("balance_cents", 0)},
+    RateLimitError: lambda d: {"retry_after": d.get("retry_after", 0)},
+}
+
 
 def _raise_for_status(status_code: int, body: dict) -> None:
     """Raise typed error from API response."""
@@ -83,9 +92,8 @@ def _raise_for_status(status_code: int, body: dict) -> None:
     cls = _ERROR_MAP.get(status_code, LeanvoxError)
 
     kwargs: dict = {"code": code, "status_code": status_code, "body": body}
-    if cls is InsufficientBalanceError:
-        kwargs["balance_cents"] = error_data.get("balance_cents", 0)
-    elif cls is RateLimitError:
-        kwargs["retry_after"] = error_data.get("retry_after", 0)
+    extra = _EXTRA_KWARGS.get(cls)
+    if extra is not None:
+        kwargs.update(extra(error_data))
 
     raise cls(message, **kwargs)
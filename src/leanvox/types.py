@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
+import sys
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
+# Read size for streamed audio: stream() and GenerateResult.save()
+_DEFAULT_STREAM_CHUNK = 64 * 1024
 
-@dataclass
+# Slotted dataclasses (3.10+) drop the per-instance __dict__, which adds up
+# across large listings. On 3.9 the types stay regular dataclasses.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class GenerateResult:
     """Result from generate() or dialogue()."""
 
@@ -32,13 +41,30 @@ class GenerateResult:
         return resp.content
 
     def save(self, path: str | os.PathLike) -> None:
-        """Download and save audio to a file."""
-        data = self.download()
-        with open(path, "wb") as f:
-            f.write(data)
+        """Download audio and stream it to a file.
 
-
-@dataclass
+        The audio is written in chunks, so memory use stays constant however
+        large the file is. A partially written file is removed on failure.
+        """
+        if self._http_client is None:
+            import httpx
+            stream = httpx.stream("GET", self.audio_url)
+        else:
+            stream = self._http_client.stream("GET", self.audio_url)
+        with stream as resp:
+            resp.raise_for_status()
+            with open(path, "wb") as f:
+                try:
+                    for chunk in resp.iter_bytes(chunk_size=_DEFAULT_STREAM_CHUNK):
+                        f.write(chunk)
+                except BaseException:
+                    f.close()
+                    with contextlib.suppress(OSError):
+                        os.remove(path)
+                    raise
+
+
+@dataclass(**_SLOTS)
 class Voice:
     """A voice resource."""
 
@@ -52,7 +78,7 @@ class Voice:
     unlock_cost_cents: float = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VoiceList:
     """Grouped voice listing."""
 
@@ -61,7 +87,7 @@ class VoiceList:
     cloned_voices: List[Voice] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Job:
     """An async generation job."""
 
@@ -72,7 +98,7 @@ class Job:
     error: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileExtractResult:
     """Result from file text extraction."""
 
@@ -82,7 +108,7 @@ class FileExtractResult:
     truncated: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Generation:
     """A historical generation."""
 
@@ -95,7 +121,7 @@ class Generation:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationList:
     """Paginated generation listing."""
 
@@ -103,7 +129,7 @@ class GenerationList:
     total: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccountBalance:
     """Account balance info."""
 
@@ -111,14 +137,27 @@ class AccountBalance:
     total_spent_cents: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccountUsage:
     """Account usage data."""
 
     entries: List[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class AccountUsageTotals:
+    """Summed usage over the entries of one usage() page.
+
+    ``by_model`` holds the same sums per model; its values have an empty
+    ``by_model`` of their own.
+    """
+
+    characters: int = 0
+    cost_cents: float = 0
+    by_model: Dict[str, AccountUsageTotals] = field(default_factory=dict)
+
+
+@dataclass(**_SLOTS)
 class TranscriptSegment:
     """A segment of transcribed audio."""
     start: float
@@ -128,21 +167,21 @@ class TranscriptSegment:
     speaker: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TranscriptData:
     """Transcript with segments."""
     text: str
     segments: List[TranscriptSegment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SpeakersData:
     """Speaker diarization results."""
     count: int
     labels: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SummaryData:
     """AI-generated summary of the transcript."""
     text: Optional[str] = None
@@ -151,7 +190,7 @@ class SummaryData:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TranscribeUsage:
     """Usage and billing info for a transcription."""
     duration_minutes: float
@@ -160,7 +199,7 @@ class TranscribeUsage:
     balance_cents: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TranscribeResult:
     """Result of an audio transcription."""
     id: str
@@ -174,7 +213,7 @@ class TranscribeResult:
     usage: Optional[TranscribeUsage] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VoiceOverResult:
     """Result from voiceover() — transcribe + re-voice pipeline."""
 
@@ -191,7 +230,7 @@ class VoiceOverResult:
         self.audio.save(path)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VoiceDesign:
     """A designed voice."""
 
@@ -199,3 +238,16 @@ class VoiceDesign:
     name: str
     status: str = ""
     cost_cents: float = 0
+
+
+# Field names accepted by each response dataclass; unknown keys are dropped.
+_VOICE_FIELDS = frozenset(Voice.__dataclass_fields__)
+_VOICE_DESIGN_FIELDS = frozenset(VoiceDesign.__dataclass_fields__)
+_FILE_EXTRACT_FIELDS = frozenset(FileExtractResult.__dataclass_fields__)
+_GENERATION_FIELDS = frozenset(Generation.__dataclass_fields__)
+_ACCOUNT_BALANCE_FIELDS = frozenset(AccountBalance.__dataclass_fields__)
+
+
+def _pick(data: dict, fields: frozenset) -> dict:
+    """Return the subset of data whose keys are in fields."""
+    return {k: data[k] for k in data.keys() & fields}
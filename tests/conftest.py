@@ -0,0 +1,102 @@
+"""Shared pytest fixtures and helpers."""
+
+import io
+import json
+
+import httpx
+import pytest
+
+from leanvox import Leanvox
+
+BASE_URL = "https://api.leanvox.com"
+API_KEY = "lv_live_test_key_123"
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Make retry and polling backoff instant."""
+    monkeypatch.setattr("time.sleep", lambda _t: None)
+
+
+@pytest.fixture
+def sleep_calls(monkeypatch):
+    """Record the waits passed to time.sleep instead of sleeping."""
+    calls = []
+    monkeypatch.setattr("time.sleep", calls.append)
+    return calls
+
+
+class FakeClock:
+    """A monotonic clock that only moves when slept on or advanced."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive time.monotonic and time.sleep from a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr("time.monotonic", clock.monotonic)
+    monkeypatch.setattr("time.sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def transport_proxies(monkeypatch):
+    """Record the proxy URL each httpx transport is built with (None if direct)."""
+    proxies: list[str | None] = []
+    for cls in (httpx.HTTPTransport, httpx.AsyncHTTPTransport):
+        def spy(self, *args, _init=cls.__init__, **kwargs):
+            proxy = kwargs.get("proxy")
+            if isinstance(proxy, str):
+                proxy = httpx.Proxy(proxy)
+            proxies.append(None if proxy is None else str(proxy.url))
+            _init(self, *args, **kwargs)
+
+        monkeypatch.setattr(cls, "__init__", spy)
+    return proxies
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One sync client per test module; respx resets routes per test."""
+    c = Leanvox(api_key=API_KEY, base_url=BASE_URL)
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def bare_client():
+    """A client that has not built its HTTP client, for validation-only tests."""
+    return Leanvox(api_key=API_KEY, base_url=BASE_URL)
+
+
+@pytest.fixture
+def fake_audio():
+    """A small in-memory WAV upload; fresh per test since reads advance it."""
+    return io.BytesIO(b"fake wav data")
+
+
+@pytest.fixture
+def fake_epub():
+    """A small in-memory EPUB upload with a filename."""
+    buf = io.BytesIO(b"fake epub content")
+    buf.name = "book.epub"
+    return buf
+
+
+def last_payload(route):
+    """Decode the JSON body of the last request a respx route received."""
+    return json.loads(route.calls.last.request.content)
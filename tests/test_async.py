@@ -1,32 +1,35 @@
 """Tests for AsyncLeanvox client methods."""
 
+import asyncio
+import json
 from unittest.mock import patch
 
 import httpx
 import pytest
-import respx
+import pytest_asyncio
 
 from leanvox import AsyncLeanvox, GenerateResult, Job
 from leanvox.errors import (
     InvalidRequestError,
+    LeanvoxError,
     RateLimitError,
     ServerError,
 )
 
-BASE_URL = "https://api.leanvox.com"
-API_KEY = "lv_live_test_key_123"
+from .conftest import API_KEY, BASE_URL, last_payload
 
 
-@pytest.fixture
-def client():
-    return AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL)
+@pytest_asyncio.fixture
+async def client():
+    c = AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL)
+    yield c
+    await c.close()
 
 
 class TestAsyncGenerate:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_generate_basic(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    async def test_generate_basic(self, client, respx_mock):
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "https://cdn.leanvox.com/audio/abc.mp3",
                 "model": "standard",
@@ -42,18 +45,16 @@ class TestAsyncGenerate:
         assert result.voice == "af_heart"
         assert result.characters == 12
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_generate_pro_with_exaggeration(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    async def test_generate_pro_with_exaggeration(self, client, respx_mock):
+        route = respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "pro",
                 "voice": "nova", "characters": 5, "cost_cents": 0.05,
             })
         )
         await client.generate("Hello", model="pro", voice="nova", exaggeration=0.7)
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["model"] == "pro"
         assert payload["exaggeration"] == 0.7
 
@@ -67,10 +68,9 @@ class TestAsyncGenerate:
         with pytest.raises(InvalidRequestError, match="must be"):
             await client.generate("Hello", model="bad")
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_generate_sets_auth_header(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    async def test_generate_sets_auth_header(self, client, respx_mock):
+        route = respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "standard",
                 "voice": "", "characters": 5, "cost_cents": 0,
@@ -81,14 +81,13 @@ class TestAsyncGenerate:
 
 
 class TestAsyncDialogue:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_dialogue_basic(self, client):
+    async def test_dialogue_basic(self, client, respx_mock):
         lines = [
             {"voice": "af_heart", "text": "Hello"},
             {"voice": "am_adam", "text": "Hi there"},
         ]
-        respx.post(f"{BASE_URL}/v1/tts/dialogue").mock(
+        respx_mock.post(f"{BASE_URL}/v1/tts/dialogue").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "https://cdn.leanvox.com/audio/dial.mp3",
                 "model": "pro",
@@ -101,22 +100,20 @@ class TestAsyncDialogue:
         assert result.voice == "dialogue"
         assert result.cost_cents == 0.14
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_dialogue_sends_correct_body(self, client):
+    async def test_dialogue_sends_correct_body(self, client, respx_mock):
         lines = [
             {"voice": "af_heart", "text": "Line 1"},
             {"voice": "am_adam", "text": "Line 2"},
         ]
-        route = respx.post(f"{BASE_URL}/v1/tts/dialogue").mock(
+        route = respx_mock.post(f"{BASE_URL}/v1/tts/dialogue").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "pro",
                 "characters": 0, "cost_cents": 0,
             })
         )
         await client.dialogue(lines, gap_ms=250)
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["gap_ms"] == 250
         assert len(payload["lines"]) == 2
 
@@ -127,10 +124,9 @@ class TestAsyncDialogue:
 
 
 class TestAsyncJobs:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_generate_async(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate-async").mock(
+    async def test_generate_async(self, client, respx_mock):
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_abc", "status": "pending",
                 "estimated_seconds": 10,
@@ -141,24 +137,21 @@ class TestAsyncJobs:
         assert job.id == "job_abc"
         assert job.status == "pending"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_generate_async_with_webhook(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate-async").mock(
+    async def test_generate_async_with_webhook(self, client, respx_mock):
+        route = respx_mock.post(f"{BASE_URL}/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_abc", "status": "pending",
                 "estimated_seconds": 5,
             })
         )
         await client.generate_async("Hello", webhook_url="https://example.com/hook")
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["webhook_url"] == "https://example.com/hook"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_job(self, client):
-        respx.get(f"{BASE_URL}/v1/jobs/job_xyz").mock(
+    async def test_get_job(self, client, respx_mock):
+        respx_mock.get(f"{BASE_URL}/v1/tts/jobs/job_xyz").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_xyz", "status": "completed",
                 "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
@@ -168,10 +161,9 @@ class TestAsyncJobs:
         assert job.status == "completed"
         assert job.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_list_jobs(self, client):
-        respx.get(f"{BASE_URL}/v1/jobs").mock(
+    async def test_list_jobs(self, client, respx_mock):
+        respx_mock.get(f"{BASE_URL}/v1/tts/jobs").mock(
             return_value=httpx.Response(200, json={
                 "jobs": [
                     {"id": "j1", "status": "completed"},
@@ -185,11 +177,10 @@ class TestAsyncJobs:
 
 
 class TestAsyncRetry:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_retries_on_500(self):
+    async def test_retries_on_500(self, respx_mock):
         async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=2) as client:
-            route = respx.post(f"{BASE_URL}/v1/tts/generate")
+            route = respx_mock.post(f"{BASE_URL}/v1/tts/generate")
             route.side_effect = [
                 httpx.Response(500, json={"error": {"message": "err"}}),
                 httpx.Response(200, json={
@@ -202,11 +193,10 @@ class TestAsyncRetry:
             assert result.audio_url == "https://cdn.leanvox.com/ok.mp3"
             assert route.call_count == 2
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_retries_on_429_with_retry_after(self):
+    async def test_retries_on_429_with_retry_after(self, respx_mock):
         async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=1) as client:
-            route = respx.post(f"{BASE_URL}/v1/tts/generate")
+            route = respx_mock.post(f"{BASE_URL}/v1/tts/generate")
             route.side_effect = [
                 httpx.Response(
                     429,
@@ -227,22 +217,20 @@ class TestAsyncRetry:
                 await client.generate("Hello")
             assert sleep_calls[0] == 2.0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_exhausts_retries_raises(self):
+    async def test_exhausts_retries_raises(self, respx_mock):
         async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=1) as client:
-            respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+            respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
                 return_value=httpx.Response(500, json={"error": {"message": "down"}})
             )
             with patch("asyncio.sleep", return_value=None):
                 with pytest.raises(ServerError, match="down"):
                     await client.generate("Hello")
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_no_retry_on_4xx(self):
+    async def test_no_retry_on_4xx(self, respx_mock):
         async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=2) as client:
-            route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+            route = respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
                 return_value=httpx.Response(401, json={
                     "error": {"message": "Unauthorized", "code": "auth_error"},
                 })
@@ -252,11 +240,96 @@ class TestAsyncRetry:
             assert route.call_count == 1
 
 
+class TestAsyncConcurrency:
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_requests(self, respx_mock):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={
+                "audio_url": "", "model": "standard",
+                "voice": "", "characters": 5, "cost_cents": 0,
+            })
+
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(side_effect=handler)
+        async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, max_concurrency=2) as client:
+            await asyncio.gather(*(client.generate("Hello") for _ in range(6)))
+        assert peak == 2
+
+
+class TestAsyncBatch:
+    @pytest.mark.asyncio
+    async def test_generate_many_preserves_order(self, client, respx_mock):
+        def handler(request):
+            text = json.loads(request.content)["text"]
+            return httpx.Response(200, json={
+                "audio_url": f"https://cdn.leanvox.com/{text}.mp3", "model": "standard",
+                "voice": "", "characters": len(text), "cost_cents": 0,
+            })
+
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(side_effect=handler)
+        results = await client.generate_many(["a", "bb", "ccc"], concurrency=2)
+        assert [r.audio_url for r in results] == [
+            "https://cdn.leanvox.com/a.mp3",
+            "https://cdn.leanvox.com/bb.mp3",
+            "https://cdn.leanvox.com/ccc.mp3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generate_many_raises_validation_error(self, client, respx_mock):
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json={
+                "audio_url": "", "model": "standard",
+                "voice": "", "characters": 2, "cost_cents": 0,
+            })
+        )
+        with pytest.raises(InvalidRequestError):
+            await client.generate_many(["ok", ""])
+
+    @pytest.mark.asyncio
+    async def test_wait_many_polls_until_done(self, client, respx_mock):
+        respx_mock.get(f"{BASE_URL}/v1/tts/jobs/job_1").mock(
+            return_value=httpx.Response(200, json={"id": "job_1", "status": "completed"})
+        )
+        respx_mock.get(f"{BASE_URL}/v1/tts/jobs/job_2").mock(side_effect=[
+            httpx.Response(200, json={"id": "job_2", "status": "processing"}),
+            httpx.Response(200, json={"id": "job_2", "status": "failed", "error": "boom"}),
+        ])
+        with patch("asyncio.sleep") as sleep:
+            jobs = await client.wait_many(["job_1", "job_2"])
+        assert [j.status for j in jobs] == ["completed", "failed"]
+        assert sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_many_long_polls(self, client, respx_mock):
+        route = respx_mock.get(f"{BASE_URL}/v1/tts/jobs/job_1").mock(
+            return_value=httpx.Response(200, json={"id": "job_1", "status": "completed"})
+        )
+        jobs = await client.wait_many(["job_1"])
+        assert jobs[0].status == "completed"
+        assert route.calls[0].request.url.params["wait"] == "30"
+
+    @pytest.mark.asyncio
+    async def test_wait_many_times_out(self, client, respx_mock, monkeypatch):
+        monkeypatch.setattr("leanvox.client._MAX_JOB_WAIT", 0.0)
+        respx_mock.get(f"{BASE_URL}/v1/tts/jobs/job_1").mock(
+            return_value=httpx.Response(200, json={"id": "job_1", "status": "pending"})
+        )
+        with pytest.raises(LeanvoxError) as exc_info:
+            await client.wait_many(["job_1"])
+        assert exc_info.value.code == "job_timeout"
+
+
 class TestAsyncContextManager:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_async_context_manager(self):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    async def test_async_context_manager(self, respx_mock):
+        respx_mock.post(f"{BASE_URL}/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "standard",
                 "voice": "", "characters": 5, "cost_cents": 0,
@@ -265,3 +338,30 @@ class TestAsyncContextManager:
         async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL) as client:
             result = await client.generate("Hello")
             assert isinstance(result, GenerateResult)
+
+    @pytest.mark.asyncio
+    async def test_warmup_opens_connection_on_enter(self, respx_mock):
+        route = respx_mock.head(f"{BASE_URL}/").mock(return_value=httpx.Response(404))
+        async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, warmup=True):
+            assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_transport_errors(self, respx_mock):
+        respx_mock.head(f"{BASE_URL}/").mock(side_effect=httpx.ConnectError("down"))
+        async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL, warmup=True):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_no_warmup_by_default(self, respx_mock):
+        route = respx_mock.head(f"{BASE_URL}/")
+        async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL):
+            assert not route.called
+
+
+class TestAsyncProxy:
+    @pytest.mark.asyncio
+    async def test_https_proxy_env_is_honored(self, monkeypatch, transport_proxies):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        async with AsyncLeanvox(api_key=API_KEY, base_url=BASE_URL) as client:
+            client._get_http()
+        assert "http://proxy.example:3128" in transport_proxies
@@ -2,11 +2,18 @@
 
 import os
 import pytest
+from leanvox import _auth
 from leanvox._auth import resolve_api_key, ensure_api_key
 from leanvox.errors import AuthenticationError
 
 
 class TestResolveApiKey:
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch, tmp_path):
+        """Start every test with no env key and no config file."""
+        monkeypatch.delenv("LEANVOX_API_KEY", raising=False)
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", tmp_path / "config.toml")
+
     def test_constructor_param_highest_priority(self, monkeypatch):
         monkeypatch.setenv("LEANVOX_API_KEY", "lv_live_env_key")
         key = resolve_api_key("lv_live_constructor_key")
@@ -17,28 +24,83 @@ class TestResolveApiKey:
         key = resolve_api_key(None)
         assert key == "lv_live_env_key"
 
-    def test_no_key_returns_none(self, monkeypatch):
-        monkeypatch.delenv("LEANVOX_API_KEY", raising=False)
+    def test_env_var_change_is_picked_up(self, monkeypatch):
+        monkeypatch.setenv("LEANVOX_API_KEY", "lv_live_first_key")
+        assert resolve_api_key(None) == "lv_live_first_key"
+        monkeypatch.setenv("LEANVOX_API_KEY", "lv_live_rotated_key")
+        assert resolve_api_key(None) == "lv_live_rotated_key"
+
+    def test_no_key_returns_none(self):
         key = resolve_api_key(None)
         assert key is None
 
     def test_invalid_prefix_raises(self):
-        with pytest.raises(AuthenticationError, match="must start with"):
+        with pytest.raises(AuthenticationError) as exc_info:
             resolve_api_key("invalid_key_123")
+        assert "must start with" in str(exc_info.value)
 
     def test_empty_string_raises(self):
-        with pytest.raises(AuthenticationError, match="cannot be empty"):
+        with pytest.raises(AuthenticationError) as exc_info:
             resolve_api_key("")
+        assert "cannot be empty" in str(exc_info.value)
 
     def test_test_prefix_accepted(self):
         key = resolve_api_key("lv_test_some_key")
         assert key == "lv_test_some_key"
 
 
+class TestConfigFile:
+    def test_config_file_fallback(self, monkeypatch, tmp_path):
+        config = tmp_path / "config.toml"
+        config.write_text('api_key = "lv_live_config_key"\n')
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", config)
+        monkeypatch.setattr(_auth, "_config_cache", None)
+        monkeypatch.delenv("LEANVOX_API_KEY", raising=False)
+        assert resolve_api_key(None) == "lv_live_config_key"
+
+    def test_config_file_reparsed_when_modified(self, monkeypatch, tmp_path):
+        config = tmp_path / "config.toml"
+        config.write_text('[auth]\napi_key = "lv_live_first"\n')
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", config)
+        monkeypatch.setattr(_auth, "_config_cache", None)
+        assert _auth._read_config_file() == "lv_live_first"
+
+        config.write_text('[auth]\napi_key = "lv_live_second"\n')
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _auth._read_config_file() == "lv_live_second"
+
+    def test_same_mtime_rewrite_is_reparsed(self, monkeypatch, tmp_path):
+        config = tmp_path / "config.toml"
+        config.write_text('api_key = "lv_live_first"\n')
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", config)
+        monkeypatch.setattr(_auth, "_config_cache", None)
+        mtime = config.stat().st_mtime_ns
+        assert _auth._read_config_file() == "lv_live_first"
+
+        config.write_text('api_key = "lv_live_rotated"\n')
+        os.utime(config, ns=(mtime, mtime))
+        assert _auth._read_config_file() == "lv_live_rotated"
+
+    def test_other_path_with_same_mtime_is_parsed(self, monkeypatch, tmp_path):
+        first = tmp_path / "first.toml"
+        second = tmp_path / "second.toml"
+        first.write_text('api_key = "lv_live_first"\n')
+        second.write_text('api_key = "lv_live_other"\n')
+        mtime = first.stat().st_mtime_ns
+        os.utime(second, ns=(mtime, mtime))
+        monkeypatch.setattr(_auth, "_config_cache", None)
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", first)
+        assert _auth._read_config_file() == "lv_live_first"
+        monkeypatch.setattr(_auth, "_CONFIG_PATH", second)
+        assert _auth._read_config_file() == "lv_live_other"
+
+
 class TestEnsureApiKey:
     def test_none_raises(self):
-        with pytest.raises(AuthenticationError, match="No API key"):
+        with pytest.raises(AuthenticationError) as exc_info:
             ensure_api_key(None)
+        assert "No API key" in str(exc_info.value)
 
     def test_valid_key_passes(self):
         assert ensure_api_key("lv_live_xxx") == "lv_live_xxx"
@@ -2,27 +2,35 @@
 
 import pytest
 import httpx
-import respx
 
-from leanvox import Leanvox, GenerateResult, Job
-from leanvox.errors import InvalidRequestError, StreamingFormatError
+from leanvox import Leanvox, GenerateResult, Job, __version__
+from leanvox.errors import InvalidRequestError, LeanvoxError, StreamingFormatError
 
+from .conftest import API_KEY, BASE_URL, last_payload
 
-BASE_URL = "https://api.leanvox.com"
-API_KEY = "lv_live_test_key_123"
+# Routes are declared relative to the API. assert_all_called stays off, as
+# with respx's default router, so tests can register routes they expect
+# not to be hit.
+pytestmark = pytest.mark.respx(base_url=BASE_URL, assert_all_called=False)
 
+# One over the 10,000-char limit, and one over the 5,000-char auto-async threshold.
+_TOO_LONG = "x" * 10_001
+_LONG_TEXT = "x" * 5001
 
-@pytest.fixture
-def client():
-    c = Leanvox(api_key=API_KEY, base_url=BASE_URL)
-    yield c
-    c.close()
+# Fake MP3 bytes; the large one spans several 64 KB stream chunks.
+_FAKE_MP3 = b"\xff\xfb\x90\x00" * 1024
+_LARGE_MP3 = _FAKE_MP3 * 50
+
+# Minimal successful /v1/tts/generate response body.
+EMPTY_GENERATE_JSON = {
+    "audio_url": "", "model": "standard",
+    "voice": "", "characters": 5, "cost_cents": 0,
+}
 
 
 class TestGenerate:
-    @respx.mock
-    def test_generate_basic(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_generate_basic(self, client, respx_mock):
+        respx_mock.post("/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "https://cdn.leanvox.com/audio/abc.mp3",
                 "model": "standard",
@@ -39,9 +47,8 @@ class TestGenerate:
         assert result.characters == 12
         assert result.cost_cents == 0.06
 
-    @respx.mock
-    def test_generate_sends_correct_body(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_generate_sends_correct_body(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "https://cdn.leanvox.com/audio/abc.mp3",
                 "model": "pro",
@@ -54,88 +61,61 @@ class TestGenerate:
             "Hello", model="pro", voice="nova", language="en",
             format="wav", speed=1.5, exaggeration=0.8,
         )
-        req = route.calls.last.request
-        body = req.content
-        import json
-        payload = json.loads(body)
-        assert payload["text"] == "Hello"
-        assert payload["model"] == "pro"
-        assert payload["voice"] == "nova"
-        assert payload["language"] == "en"
-        assert payload["format"] == "wav"
-        assert payload["speed"] == 1.5
-        assert payload["exaggeration"] == 0.8
-
-    @respx.mock
-    def test_generate_standard_omits_exaggeration(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
-            return_value=httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            })
+        assert last_payload(route) == {
+            "text": "Hello", "model": "pro", "voice": "nova", "language": "en",
+            "format": "wav", "speed": 1.5, "exaggeration": 0.8,
+        }
+
+    def test_generate_standard_omits_exaggeration(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
         )
         client.generate("Hello")
-        import json
-        payload = json.loads(route.calls.last.request.content)
-        assert "exaggeration" not in payload
+        assert b'"exaggeration"' not in route.calls.last.request.content
 
-    @respx.mock
-    def test_generate_omits_empty_voice(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
-            return_value=httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            })
+    def test_generate_omits_empty_voice(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
         )
         client.generate("Hello")
-        import json
-        payload = json.loads(route.calls.last.request.content)
-        assert "voice" not in payload
+        assert b'"voice"' not in route.calls.last.request.content
 
-    @respx.mock
-    def test_generate_includes_voice_when_set(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_generate_includes_voice_when_set(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "standard",
                 "voice": "af_heart", "characters": 5, "cost_cents": 0,
             })
         )
         client.generate("Hello", voice="af_heart")
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["voice"] == "af_heart"
 
-    def test_generate_empty_text_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="cannot be empty"):
-            client.generate("")
-
-    def test_generate_text_too_long_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="exceeds maximum"):
-            client.generate("x" * 10_001)
-
-    def test_generate_invalid_model_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="must be"):
-            client.generate("Hello", model="bad")
-
-    def test_generate_speed_out_of_range_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="Speed"):
-            client.generate("Hello", speed=3.0)
-
-    def test_generate_exaggeration_on_standard_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="exaggeration"):
-            client.generate("Hello", model="standard", exaggeration=0.8)
-
-    @respx.mock
-    def test_generate_auto_async_long_text(self, client):
+    @pytest.mark.parametrize("kwargs, message", [
+        ({"text": ""}, "cannot be empty"),
+        ({"text": _TOO_LONG}, "exceeds maximum"),
+        ({"model": "bad"}, "must be"),
+        ({"speed": 3.0}, "Speed"),
+        ({"speed": float("nan")}, "Speed"),
+        ({"model": "standard", "exaggeration": 0.8}, "exaggeration"),
+    ], ids=["empty_text", "text_too_long", "invalid_model", "speed_out_of_range", "speed_nan", "exaggeration_on_standard"])
+    def test_generate_validation(self, bare_client, kwargs, message):
+        kwargs = {"text": "Hello", **kwargs}
+        with pytest.raises(InvalidRequestError) as exc_info:
+            bare_client.generate(**kwargs)
+        assert message in str(exc_info.value)
+        assert bare_client._http is None
+
+    def test_generate_auto_async_long_text(self, client, respx_mock):
         """Text exceeding auto_async_threshold should use async path."""
-        long_text = "x" * 5001  # exceeds default 5000
+        long_text = _LONG_TEXT
 
-        respx.post(f"{BASE_URL}/v1/tts/generate-async").mock(
+        respx_mock.post("/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_123", "status": "pending", "estimated_seconds": 10,
             })
         )
-        respx.get(f"{BASE_URL}/v1/jobs/job_123").mock(
+        respx_mock.get("/v1/tts/jobs/job_123").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_123", "status": "completed",
                 "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
@@ -145,66 +125,214 @@ class TestGenerate:
         assert isinstance(result, GenerateResult)
         assert result.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
 
-    @respx.mock
-    def test_generate_sets_auth_header(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_generate_auto_async_polls_with_backoff(self, client, respx_mock, sleep_calls):
+        respx_mock.post("/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
+                "job_id": "job_123", "status": "pending", "estimated_seconds": 10,
+            })
+        )
+        job_route = respx_mock.get("/v1/tts/jobs/job_123")
+        job_route.side_effect = [
+            httpx.Response(400, json={"error": {"code": "invalid_request", "message": "wait"}}),
+            httpx.Response(200, json={"id": "job_123", "status": "processing"}),
+            httpx.Response(200, json={"id": "job_123", "status": "processing"}),
+            httpx.Response(200, json={
+                "id": "job_123", "status": "completed",
+                "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
+            }),
+        ]
+        result = client.generate(_LONG_TEXT)
+        assert result.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
+        assert len(sleep_calls) == 3
+        for call, base in zip(sleep_calls, [0.25, 0.5, 1.0]):
+            assert base <= call <= base * 1.1
+
+    def test_generate_auto_async_long_polls(self, client, respx_mock, sleep_calls):
+        respx_mock.post("/v1/tts/generate/async").mock(
+            return_value=httpx.Response(200, json={
+                "job_id": "job_123", "status": "pending", "estimated_seconds": 10,
+            })
+        )
+        job_route = respx_mock.get("/v1/tts/jobs/job_123").mock(
+            return_value=httpx.Response(200, json={
+                "id": "job_123", "status": "completed",
+                "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
             })
         )
+        result = client.generate(_LONG_TEXT)
+        assert result.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
+        assert job_route.call_count == 1
+        assert job_route.calls[0].request.url.params["wait"] == "30"
+        assert sleep_calls == []
+
+    def test_generate_auto_async_slow_server_backs_off_and_times_out(
+        self, client, respx_mock, fake_clock,
+    ):
+        respx_mock.post("/v1/tts/generate/async").mock(
+            return_value=httpx.Response(200, json={"job_id": "job_123", "status": "pending"})
+        )
+
+        # A server that ignores wait but takes 1.5s to answer.
+        def slow_processing(request):
+            fake_clock.advance(1.5)
+            return httpx.Response(200, json={"id": "job_123", "status": "processing"})
+
+        job_route = respx_mock.get("/v1/tts/jobs/job_123").mock(side_effect=slow_processing)
+        with pytest.raises(LeanvoxError) as exc_info:
+            client.generate(_LONG_TEXT)
+        assert exc_info.value.code == "job_timeout"
+        assert fake_clock.sleeps
+        assert max(fake_clock.sleeps) == pytest.approx(30.0 - 1.5)
+        assert job_route.call_count < 100
+
+    def test_generate_auto_async_long_poll_fits_total_timeout(self, respx_mock, fake_clock):
+        respx_mock.post("/v1/tts/generate/async").mock(
+            return_value=httpx.Response(200, json={"job_id": "job_123", "status": "pending"})
+        )
+
+        # A server that honors wait; holding past total_timeout times the request out.
+        def honors_wait(request):
+            wait = int(request.url.params["wait"])
+            if wait >= 20:
+                raise httpx.ReadTimeout("Request timed out")
+            fake_clock.advance(wait)
+            return httpx.Response(200, json={
+                "id": "job_123", "status": "completed",
+                "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
+            })
+
+        job_route = respx_mock.get("/v1/tts/jobs/job_123").mock(side_effect=honors_wait)
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL, total_timeout=20) as c:
+            result = c.generate(_LONG_TEXT)
+        assert result.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
+        assert job_route.call_count == 1
+        assert job_route.calls[0].request.url.params["wait"] == "15"
+
+    def test_generate_auto_async_long_poll_timeout_falls_back(self, client, respx_mock):
+        respx_mock.post("/v1/tts/generate/async").mock(
+            return_value=httpx.Response(200, json={"job_id": "job_123", "status": "pending"})
+        )
+
+        def times_out_on_wait(request):
+            if "wait" in request.url.params:
+                raise httpx.ReadTimeout("Request timed out")
+            return httpx.Response(200, json={
+                "id": "job_123", "status": "completed",
+                "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
+            })
+
+        respx_mock.get("/v1/tts/jobs/job_123").mock(side_effect=times_out_on_wait)
+        result = client.generate(_LONG_TEXT)
+        assert result.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
+
+    def test_generate_default_body(self, client, respx_mock):
+        respx_mock.post("/v1/tts/generate/async").mock(
+            return_value=httpx.Response(200, json={"job_id": "job_1", "status": "pending"})
+        )
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
+        )
+        client.generate_async("Hello", webhook_url="https://example.com/hook")
+        client.generate("Hello")
+        assert last_payload(route) == {
+            "text": "Hello", "model": "standard", "language": "en",
+            "format": "mp3", "speed": 1.0,
+        }
+
+    def test_generate_sets_auth_header(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
+        )
         client.generate("Hello")
         assert route.calls.last.request.headers["authorization"] == f"Bearer {API_KEY}"
 
-    @respx.mock
-    def test_generate_sets_user_agent(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_generate_sends_json_body(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
+        )
+        client.generate("Héllo wörld")
+        request = route.calls.last.request
+        assert request.headers["content-type"] == "application/json"
+        assert last_payload(route)["text"] == "Héllo wörld"
+
+    def test_generate_sets_user_agent(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
+        )
+        client.generate("Hello")
+        assert route.calls.last.request.headers["user-agent"] == f"leanvox-python/{__version__}"
+
+
+class TestSave:
+    def test_save_streams_audio_to_file(self, client, tmp_path, respx_mock):
+        respx_mock.post("/v1/tts/generate").mock(
             return_value=httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
+                **EMPTY_GENERATE_JSON, "audio_url": "https://cdn.leanvox.com/audio/abc.mp3",
             })
         )
-        client.generate("Hello")
-        assert "leanvox-python" in route.calls.last.request.headers["user-agent"]
+        respx_mock.get("https://cdn.leanvox.com/audio/abc.mp3").mock(
+            return_value=httpx.Response(200, content=_LARGE_MP3)
+        )
+        out = tmp_path / "out.mp3"
+        client.generate("Hello").save(out)
+        assert out.read_bytes() == _LARGE_MP3
+
+    def test_save_http_error_leaves_no_file(self, tmp_path, respx_mock):
+        respx_mock.get("https://cdn.leanvox.com/audio/gone.mp3").mock(
+            return_value=httpx.Response(404)
+        )
+        result = GenerateResult(
+            audio_url="https://cdn.leanvox.com/audio/gone.mp3", model="standard",
+            voice="", characters=5, cost_cents=0,
+        )
+        out = tmp_path / "out.mp3"
+        with pytest.raises(httpx.HTTPStatusError):
+            result.save(out)
+        assert not out.exists()
 
 
 class TestStream:
-    @respx.mock
-    def test_stream_yields_chunks(self, client):
-        audio_data = b"\xff\xfb\x90\x00" * 1024  # fake MP3 data
-        respx.post(f"{BASE_URL}/v1/tts/stream").mock(
-            return_value=httpx.Response(200, content=audio_data)
+    def test_stream_yields_chunks(self, client, respx_mock):
+        respx_mock.post("/v1/tts/stream").mock(
+            return_value=httpx.Response(200, content=_FAKE_MP3)
         )
         with client.stream("Hello world!") as chunks:
             collected = b"".join(chunks)
-        assert collected == audio_data
+        assert collected == _FAKE_MP3
 
-    def test_stream_non_mp3_raises(self, client):
-        with pytest.raises(StreamingFormatError, match="MP3"):
-            with client.stream("Hello", format="wav") as _:
+    def test_stream_custom_chunk_size(self, client, respx_mock):
+        respx_mock.post("/v1/tts/stream").mock(
+            return_value=httpx.Response(200, content=b"\x00" * 10)
+        )
+        with client.stream("Hello world!", chunk_size=4) as chunks:
+            sizes = [len(c) for c in chunks]
+        assert sizes == [4, 4, 2]
+
+    def test_stream_non_mp3_raises(self, bare_client):
+        with pytest.raises(StreamingFormatError) as exc_info:
+            with bare_client.stream("Hello", format="wav") as _:
                 pass
+        assert "MP3" in str(exc_info.value)
+        assert bare_client._http is None
 
-    @respx.mock
-    def test_stream_sends_correct_body(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/stream").mock(
+    def test_stream_sends_correct_body(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/stream").mock(
             return_value=httpx.Response(200, content=b"audio")
         )
         with client.stream("Test", voice="nova", model="standard") as chunks:
             _ = b"".join(chunks)
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["text"] == "Test"
         assert payload["format"] == "mp3"
 
 
 class TestDialogue:
-    @respx.mock
-    def test_dialogue_basic(self, client):
+    def test_dialogue_basic(self, client, respx_mock):
         lines = [
             {"voice": "af_heart", "text": "Hello"},
             {"voice": "am_adam", "text": "Hi there"},
         ]
-        respx.post(f"{BASE_URL}/v1/tts/dialogue").mock(
+        respx_mock.post("/v1/tts/dialogue").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "https://cdn.leanvox.com/audio/dial.mp3",
                 "model": "pro",
@@ -218,38 +346,38 @@ class TestDialogue:
         assert result.voice == "dialogue"
         assert result.cost_cents == 0.14
 
-    @respx.mock
-    def test_dialogue_sends_correct_body(self, client):
+    def test_dialogue_sends_correct_body(self, client, respx_mock):
         lines = [
             {"voice": "af_heart", "text": "Hello"},
             {"voice": "am_adam", "text": "Hi there"},
         ]
-        route = respx.post(f"{BASE_URL}/v1/tts/dialogue").mock(
+        route = respx_mock.post("/v1/tts/dialogue").mock(
             return_value=httpx.Response(200, json={
                 "audio_url": "", "model": "pro",
                 "characters": 14, "cost_cents": 0,
             })
         )
         client.dialogue(lines, gap_ms=300)
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["model"] == "pro"
         assert payload["gap_ms"] == 300
         assert len(payload["lines"]) == 2
 
-    def test_dialogue_too_few_lines_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="at least 2"):
-            client.dialogue([{"voice": "af_heart", "text": "solo"}])
+    def test_dialogue_too_few_lines_raises(self, bare_client):
+        with pytest.raises(InvalidRequestError) as exc_info:
+            bare_client.dialogue([{"voice": "af_heart", "text": "solo"}])
+        assert "at least 2" in str(exc_info.value)
+        assert bare_client._http is None
 
-    def test_dialogue_empty_lines_raises(self, client):
-        with pytest.raises(InvalidRequestError, match="at least 2"):
-            client.dialogue([])
+    def test_dialogue_empty_lines_raises(self, bare_client):
+        with pytest.raises(InvalidRequestError) as exc_info:
+            bare_client.dialogue([])
+        assert "at least 2" in str(exc_info.value)
 
 
 class TestAsyncJobs:
-    @respx.mock
-    def test_generate_async(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate-async").mock(
+    def test_generate_async(self, client, respx_mock):
+        respx_mock.post("/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_abc", "status": "pending",
                 "estimated_seconds": 15,
@@ -261,22 +389,19 @@ class TestAsyncJobs:
         assert job.status == "pending"
         assert job.estimated_seconds == 15
 
-    @respx.mock
-    def test_generate_async_with_webhook(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate-async").mock(
+    def test_generate_async_with_webhook(self, client, respx_mock):
+        route = respx_mock.post("/v1/tts/generate/async").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_abc", "status": "pending",
                 "estimated_seconds": 5,
             })
         )
         client.generate_async("Hello", webhook_url="https://example.com/hook")
-        import json
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["webhook_url"] == "https://example.com/hook"
 
-    @respx.mock
-    def test_get_job(self, client):
-        respx.get(f"{BASE_URL}/v1/jobs/job_xyz").mock(
+    def test_get_job(self, client, respx_mock):
+        respx_mock.get("/v1/tts/jobs/job_xyz").mock(
             return_value=httpx.Response(200, json={
                 "id": "job_xyz", "status": "completed",
                 "audio_url": "https://cdn.leanvox.com/audio/done.mp3",
@@ -286,9 +411,8 @@ class TestAsyncJobs:
         assert job.status == "completed"
         assert job.audio_url == "https://cdn.leanvox.com/audio/done.mp3"
 
-    @respx.mock
-    def test_list_jobs(self, client):
-        respx.get(f"{BASE_URL}/v1/jobs").mock(
+    def test_list_jobs(self, client, respx_mock):
+        respx_mock.get("/v1/tts/jobs").mock(
             return_value=httpx.Response(200, json={
                 "jobs": [
                     {"id": "j1", "status": "completed"},
@@ -303,14 +427,58 @@ class TestAsyncJobs:
 
 
 class TestClientContextManager:
-    @respx.mock
-    def test_context_manager(self):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
-            return_value=httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            })
+    def test_context_manager(self, respx_mock):
+        respx_mock.post("/v1/tts/generate").mock(
+            return_value=httpx.Response(200, json=EMPTY_GENERATE_JSON)
         )
         with Leanvox(api_key=API_KEY, base_url=BASE_URL) as client:
             result = client.generate("Hello")
             assert isinstance(result, GenerateResult)
+
+
+@pytest.fixture
+def isolated_pool(monkeypatch):
+    """Swap in empty connection pools so the module-scoped client is untouched."""
+    monkeypatch.setattr("leanvox.client._HTTP_POOL", {})
+
+
+@pytest.mark.usefixtures("isolated_pool")
+class TestConnectionReuse:
+    def test_clients_share_pooled_http_client(self):
+        from leanvox import client as client_module
+
+        a = Leanvox(api_key=API_KEY, base_url=BASE_URL)
+        b = Leanvox(api_key=API_KEY, base_url=BASE_URL)
+        http = a._get_http()
+        assert b._get_http() is http
+
+        a.close()
+        assert not http.raw_client.is_closed
+        b.close()
+        assert http.raw_client.is_closed
+        assert not client_module._HTTP_POOL
+
+    def test_close_drops_cached_resources(self):
+        c = Leanvox(api_key=API_KEY, base_url=BASE_URL)
+        old = c.voices._http
+        c.close()
+        assert old.raw_client.is_closed
+        assert c.voices._http is c._get_http()
+        assert c.voices._http is not old
+        c.close()
+
+    def test_https_proxy_env_is_honored(self, monkeypatch, transport_proxies):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL) as c:
+            c._get_http()
+        assert "http://proxy.example:3128" in transport_proxies
+
+    def test_shutdown_pool_closes_clients(self):
+        from leanvox import client as client_module
+
+        c = Leanvox(api_key=API_KEY, base_url=BASE_URL)
+        http = c._get_http()
+        Leanvox.shutdown_pool()
+        assert http.raw_client.is_closed
+        assert not client_module._HTTP_POOL
+        c.close()
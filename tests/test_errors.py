@@ -17,42 +17,27 @@ class TestRaiseForStatus:
     def test_200_no_error(self):
         _raise_for_status(200, {})
 
-    def test_400_invalid_request(self):
-        with pytest.raises(InvalidRequestError) as exc_info:
-            _raise_for_status(400, {"error": {"message": "bad", "code": "invalid_request"}})
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.code == "invalid_request"
-
-    def test_401_auth_error(self):
-        with pytest.raises(AuthenticationError):
-            _raise_for_status(401, {"error": {"message": "invalid key", "code": "invalid_api_key"}})
-
-    def test_402_balance_error(self):
-        with pytest.raises(InsufficientBalanceError) as exc_info:
-            _raise_for_status(402, {"error": {"message": "low", "code": "insufficient_balance", "balance_cents": 50}})
-        assert exc_info.value.balance_cents == 50
-
-    def test_404_not_found(self):
-        with pytest.raises(NotFoundError):
-            _raise_for_status(404, {"error": {"message": "nope", "code": "not_found"}})
-
-    def test_429_rate_limit(self):
-        with pytest.raises(RateLimitError) as exc_info:
-            _raise_for_status(429, {"error": {"message": "slow down", "code": "rate_limit_exceeded", "retry_after": 5}})
-        assert exc_info.value.retry_after == 5
-
-    def test_500_server_error(self):
-        with pytest.raises(ServerError):
-            _raise_for_status(500, {"error": {"message": "boom", "code": "server_error"}})
-
-    def test_unknown_status(self):
-        with pytest.raises(LeanvoxError):
-            _raise_for_status(418, {"error": {"message": "teapot", "code": "teapot"}})
+    @pytest.mark.parametrize("status, error, exc_cls, attrs", [
+        (400, {"message": "bad", "code": "invalid_request"}, InvalidRequestError,
+         {"status_code": 400, "code": "invalid_request"}),
+        (401, {"message": "invalid key", "code": "invalid_api_key"}, AuthenticationError, {}),
+        (402, {"message": "low", "code": "insufficient_balance", "balance_cents": 50},
+         InsufficientBalanceError, {"balance_cents": 50}),
+        (404, {"message": "nope", "code": "not_found"}, NotFoundError, {}),
+        (429, {"message": "slow down", "code": "rate_limit_exceeded", "retry_after": 5},
+         RateLimitError, {"retry_after": 5}),
+        (500, {"message": "boom", "code": "server_error"}, ServerError, {}),
+        (418, {"message": "teapot", "code": "teapot"}, LeanvoxError, {}),
+    ], ids=["400", "401", "402", "404", "429", "500", "unknown"])
+    def test_status_maps_to_error(self, status, error, exc_cls, attrs):
+        with pytest.raises(exc_cls) as exc_info:
+            _raise_for_status(status, {"error": error})
+        for name, value in attrs.items():
+            assert getattr(exc_info.value, name) == value
 
 
 class TestErrorHierarchy:
     def test_all_inherit_from_leanvox_error(self):
         for cls in [InvalidRequestError, AuthenticationError, InsufficientBalanceError,
                      NotFoundError, RateLimitError, ServerError]:
-            err = cls("test", code="test", status_code=0)
-            assert isinstance(err, LeanvoxError)
+            assert issubclass(cls, LeanvoxError)
@@ -1,16 +1,16 @@
 """Tests for resource classes — voices, files, generations, account."""
 
+import base64
 import io
 import json
 
 import httpx
 import pytest
-import respx
 
 from leanvox import (
-    Leanvox,
     AccountBalance,
     AccountUsage,
+    AccountUsageTotals,
     FileExtractResult,
     Generation,
     GenerationList,
@@ -18,31 +18,48 @@ from leanvox import (
     VoiceDesign,
     VoiceList,
 )
-
-BASE_URL = "https://api.leanvox.com"
-API_KEY = "lv_live_test_key_123"
-
-
-@pytest.fixture
-def client():
-    c = Leanvox(api_key=API_KEY, base_url=BASE_URL)
-    yield c
-    c.close()
+from leanvox.errors import InvalidRequestError
+
+from .conftest import API_KEY, BASE_URL, last_payload
+
+# Routes are declared relative to the API. assert_all_called stays off, as
+# with respx's default router, so tests can register routes they expect
+# not to be hit.
+pytestmark = pytest.mark.respx(base_url=BASE_URL, assert_all_called=False)
+
+# The largest canned listings, encoded once at import.
+_JSON_HEADERS = {"content-type": "application/json"}
+_VOICES_LIST_BYTES = json.dumps({
+    "standard_voices": [
+        {"voice_id": "af_heart", "name": "Heart", "model": "standard", "language": "en"},
+    ],
+    "pro_voices": [
+        {"voice_id": "nova", "name": "Nova", "model": "pro", "language": "en"},
+    ],
+    "cloned_voices": [],
+}).encode()
+_GENERATIONS_LIST_BYTES = json.dumps({
+    "generations": [
+        {"id": "gen_1", "model": "standard", "voice": "af_heart",
+         "characters": 100, "cost_cents": 0.5, "audio_url": "https://cdn.leanvox.com/a.mp3"},
+        {"id": "gen_2", "model": "pro", "voice": "nova",
+         "characters": 200, "cost_cents": 2.0, "audio_url": "https://cdn.leanvox.com/b.mp3"},
+    ],
+    "total": 42,
+}).encode()
+
+
+class TestResourceAccess:
+    def test_resources_are_memoized(self, client):
+        assert client.voices is client.voices
+        assert client.audio is client.audio
+        assert client.account is client.account
 
 
 class TestVoicesList:
-    @respx.mock
-    def test_list_all_voices(self, client):
-        respx.get(f"{BASE_URL}/v1/voices").mock(
-            return_value=httpx.Response(200, json={
-                "standard_voices": [
-                    {"voice_id": "af_heart", "name": "Heart", "model": "standard", "language": "en"},
-                ],
-                "pro_voices": [
-                    {"voice_id": "nova", "name": "Nova", "model": "pro", "language": "en"},
-                ],
-                "cloned_voices": [],
-            })
+    def test_list_all_voices(self, client, respx_mock):
+        respx_mock.get("/v1/voices").mock(
+            return_value=httpx.Response(200, content=_VOICES_LIST_BYTES, headers=_JSON_HEADERS)
         )
         result = client.voices.list()
         assert isinstance(result, VoiceList)
@@ -52,9 +69,8 @@ class TestVoicesList:
         assert result.standard_voices[0].voice_id == "af_heart"
         assert result.pro_voices[0].name == "Nova"
 
-    @respx.mock
-    def test_list_voices_with_model_filter(self, client):
-        route = respx.get(f"{BASE_URL}/v1/voices").mock(
+    def test_list_voices_with_model_filter(self, client, respx_mock):
+        route = respx_mock.get("/v1/voices").mock(
             return_value=httpx.Response(200, json={
                 "standard_voices": [
                     {"voice_id": "af_heart", "name": "Heart"},
@@ -66,9 +82,8 @@ class TestVoicesList:
         client.voices.list(model="standard")
         assert route.calls.last.request.url.params["model"] == "standard"
 
-    @respx.mock
-    def test_list_curated(self, client):
-        respx.get(f"{BASE_URL}/v1/voices/curated").mock(
+    def test_list_curated(self, client, respx_mock):
+        respx_mock.get("/v1/voices/curated").mock(
             return_value=httpx.Response(200, json={
                 "voices": [
                     {"voice_id": "nova", "name": "Nova", "model": "pro",
@@ -82,9 +97,8 @@ class TestVoicesList:
 
 
 class TestVoicesClone:
-    @respx.mock
-    def test_clone_with_base64(self, client):
-        route = respx.post(f"{BASE_URL}/v1/voices/clone").mock(
+    def test_clone_with_base64(self, client, respx_mock):
+        route = respx_mock.post("/v1/voices/clone").mock(
             return_value=httpx.Response(200, json={
                 "voice_id": "cloned_abc",
                 "name": "My Voice",
@@ -92,17 +106,45 @@ class TestVoicesClone:
                 "status": "pending_unlock",
             })
         )
-        voice = client.voices.clone("My Voice", "base64audiodatahere==")
+        audio_b64 = base64.b64encode(b"fake wav data").decode()
+        voice = client.voices.clone("My Voice", audio_b64)
         assert isinstance(voice, Voice)
         assert voice.voice_id == "cloned_abc"
         assert voice.status == "pending_unlock"
-        payload = json.loads(route.calls.last.request.content)
+        request = route.calls.last.request
+        assert request.headers["content-type"].startswith("multipart/form-data")
+        assert b"fake wav data" in request.content
+        assert b"My Voice" in request.content
+
+    def test_clone_with_base64_json_body(self, client, respx_mock):
+        route = respx_mock.post("/v1/voices/clone").mock(
+            return_value=httpx.Response(200, json={
+                "voice_id": "cloned_abc", "name": "My Voice",
+            })
+        )
+        client.voices.clone("My Voice", "base64audiodatahere==", send_base64=True)
+        payload = last_payload(route)
         assert payload["name"] == "My Voice"
         assert payload["audio_base64"] == "base64audiodatahere=="
 
-    @respx.mock
-    def test_clone_with_file_upload(self, client):
-        respx.post(f"{BASE_URL}/v1/voices/clone").mock(
+    @pytest.mark.parametrize("audio", [
+        "data:audio/wav;base64," + base64.b64encode(b"fake wav data").decode(),
+        base64.encodebytes(b"fake wav data" * 10).decode(),
+    ], ids=["data_uri", "line_wrapped"])
+    def test_clone_accepts_data_uri_and_wrapped_base64(self, client, respx_mock, audio):
+        route = respx_mock.post("/v1/voices/clone").mock(
+            return_value=httpx.Response(200, json={"voice_id": "cloned_abc", "name": "My Voice"})
+        )
+        client.voices.clone("My Voice", audio)
+        assert b"fake wav data" in route.calls.last.request.content
+
+    @pytest.mark.parametrize("audio", ["not base64!", "/tmp/voices/a.wav"], ids=["garbage", "path"])
+    def test_clone_invalid_base64_raises(self, client, audio):
+        with pytest.raises(InvalidRequestError, match="base64"):
+            client.voices.clone("My Voice", audio)
+
+    def test_clone_with_file_upload(self, client, respx_mock, fake_audio):
+        route = respx_mock.post("/v1/voices/clone").mock(
             return_value=httpx.Response(200, json={
                 "voice_id": "cloned_def",
                 "name": "Uploaded Voice",
@@ -110,13 +152,15 @@ class TestVoicesClone:
                 "status": "pending_unlock",
             })
         )
-        audio_file = io.BytesIO(b"fake wav data")
-        voice = client.voices.clone("Uploaded Voice", audio_file)
+        voice = client.voices.clone("Uploaded Voice", fake_audio, description="Mine")
         assert voice.voice_id == "cloned_def"
+        body = route.calls.last.request.content
+        assert b'name="audio"; filename="audio.wav"' in body
+        assert b'name="name"\r\n\r\nUploaded Voice' in body
+        assert b'name="description"\r\n\r\nMine' in body
 
-    @respx.mock
-    def test_clone_auto_unlock(self, client):
-        respx.post(f"{BASE_URL}/v1/voices/clone").mock(
+    def test_clone_auto_unlock(self, client, respx_mock):
+        respx_mock.post("/v1/voices/clone").mock(
             return_value=httpx.Response(200, json={
                 "voice_id": "cloned_ghi",
                 "name": "Auto Unlock",
@@ -124,15 +168,14 @@ class TestVoicesClone:
                 "status": "pending_unlock",
             })
         )
-        respx.post(f"{BASE_URL}/v1/voices/cloned_ghi/unlock").mock(
+        respx_mock.post("/v1/voices/cloned_ghi/unlock").mock(
             return_value=httpx.Response(200, json={"status": "active"})
         )
         voice = client.voices.clone("Auto Unlock", "base64data==", auto_unlock=True)
         assert voice.status == "active"
 
-    @respx.mock
-    def test_clone_no_auto_unlock_if_already_active(self, client):
-        respx.post(f"{BASE_URL}/v1/voices/clone").mock(
+    def test_clone_no_auto_unlock_if_already_active(self, client, respx_mock):
+        respx_mock.post("/v1/voices/clone").mock(
             return_value=httpx.Response(200, json={
                 "voice_id": "cloned_jkl",
                 "name": "Already Active",
@@ -141,7 +184,7 @@ class TestVoicesClone:
             })
         )
         # unlock should not be called
-        unlock_route = respx.post(f"{BASE_URL}/v1/voices/cloned_jkl/unlock").mock(
+        unlock_route = respx_mock.post("/v1/voices/cloned_jkl/unlock").mock(
             return_value=httpx.Response(200, json={})
         )
         voice = client.voices.clone("Already Active", "base64data==", auto_unlock=True)
@@ -150,9 +193,8 @@ class TestVoicesClone:
 
 
 class TestVoicesDesign:
-    @respx.mock
-    def test_design_voice(self, client):
-        route = respx.post(f"{BASE_URL}/v1/voices/design").mock(
+    def test_design_voice(self, client, respx_mock):
+        route = respx_mock.post("/v1/voices/design").mock(
             return_value=httpx.Response(200, json={
                 "id": "design_123",
                 "name": "Warm Narrator",
@@ -164,27 +206,25 @@ class TestVoicesDesign:
         assert isinstance(design, VoiceDesign)
         assert design.id == "design_123"
         assert design.cost_cents == 100
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["name"] == "Warm Narrator"
         assert payload["prompt"] == "A warm, friendly male narrator"
         assert "language" not in payload
         assert "description" not in payload
 
-    @respx.mock
-    def test_design_voice_with_optional_params(self, client):
-        route = respx.post(f"{BASE_URL}/v1/voices/design").mock(
+    def test_design_voice_with_optional_params(self, client, respx_mock):
+        route = respx_mock.post("/v1/voices/design").mock(
             return_value=httpx.Response(200, json={
                 "id": "design_456", "name": "Test", "status": "processing",
             })
         )
         client.voices.design("Test", "prompt", language="fr", description="French voice")
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["language"] == "fr"
         assert payload["description"] == "French voice"
 
-    @respx.mock
-    def test_list_designs(self, client):
-        respx.get(f"{BASE_URL}/v1/voices/designs").mock(
+    def test_list_designs(self, client, respx_mock):
+        respx_mock.get("/v1/voices/designs").mock(
             return_value=httpx.Response(200, json={
                 "designs": [
                     {"id": "d1", "name": "Voice A", "status": "completed"},
@@ -199,17 +239,15 @@ class TestVoicesDesign:
 
 
 class TestVoicesDelete:
-    @respx.mock
-    def test_delete_voice(self, client):
-        route = respx.delete(f"{BASE_URL}/v1/voices/voice_abc").mock(
+    def test_delete_voice(self, client, respx_mock):
+        route = respx_mock.delete("/v1/voices/voice_abc").mock(
             return_value=httpx.Response(204)
         )
         client.voices.delete("voice_abc")
         assert route.called
 
-    @respx.mock
-    def test_unlock_voice(self, client):
-        respx.post(f"{BASE_URL}/v1/voices/voice_abc/unlock").mock(
+    def test_unlock_voice(self, client, respx_mock):
+        respx_mock.post("/v1/voices/voice_abc/unlock").mock(
             return_value=httpx.Response(200, json={"status": "active"})
         )
         result = client.voices.unlock("voice_abc")
@@ -217,9 +255,8 @@ class TestVoicesDelete:
 
 
 class TestFilesResource:
-    @respx.mock
-    def test_extract_text(self, client):
-        respx.post(f"{BASE_URL}/v1/files/extract-text").mock(
+    def test_extract_text(self, client, respx_mock, fake_epub):
+        respx_mock.post("/v1/files/extract-text").mock(
             return_value=httpx.Response(200, json={
                 "text": "Chapter 1: The Beginning",
                 "filename": "book.epub",
@@ -227,18 +264,15 @@ class TestFilesResource:
                 "truncated": False,
             })
         )
-        file = io.BytesIO(b"fake epub content")
-        file.name = "book.epub"
-        result = client.files.extract_text(file)
+        result = client.files.extract_text(fake_epub)
         assert isinstance(result, FileExtractResult)
         assert result.text == "Chapter 1: The Beginning"
         assert result.filename == "book.epub"
         assert result.char_count == 24
         assert result.truncated is False
 
-    @respx.mock
-    def test_extract_text_truncated(self, client):
-        respx.post(f"{BASE_URL}/v1/files/extract-text").mock(
+    def test_extract_text_truncated(self, client, respx_mock):
+        respx_mock.post("/v1/files/extract-text").mock(
             return_value=httpx.Response(200, json={
                 "text": "Truncated content...",
                 "filename": "big.txt",
@@ -252,18 +286,9 @@ class TestFilesResource:
 
 
 class TestGenerationsResource:
-    @respx.mock
-    def test_list_generations(self, client):
-        respx.get(f"{BASE_URL}/v1/generations").mock(
-            return_value=httpx.Response(200, json={
-                "generations": [
-                    {"id": "gen_1", "model": "standard", "voice": "af_heart",
-                     "characters": 100, "cost_cents": 0.5, "audio_url": "https://cdn.leanvox.com/a.mp3"},
-                    {"id": "gen_2", "model": "pro", "voice": "nova",
-                     "characters": 200, "cost_cents": 2.0, "audio_url": "https://cdn.leanvox.com/b.mp3"},
-                ],
-                "total": 42,
-            })
+    def test_list_generations(self, client, respx_mock):
+        respx_mock.get("/v1/generations").mock(
+            return_value=httpx.Response(200, content=_GENERATIONS_LIST_BYTES, headers=_JSON_HEADERS)
         )
         result = client.generations.list()
         assert isinstance(result, GenerationList)
@@ -272,9 +297,8 @@ class TestGenerationsResource:
         assert result.generations[0].id == "gen_1"
         assert result.generations[1].cost_cents == 2.0
 
-    @respx.mock
-    def test_list_generations_pagination(self, client):
-        route = respx.get(f"{BASE_URL}/v1/generations").mock(
+    def test_list_generations_pagination(self, client, respx_mock):
+        route = respx_mock.get("/v1/generations").mock(
             return_value=httpx.Response(200, json={
                 "generations": [], "total": 0,
             })
@@ -284,9 +308,43 @@ class TestGenerationsResource:
         assert params["limit"] == "10"
         assert params["offset"] == "20"
 
-    @respx.mock
-    def test_get_audio(self, client):
-        respx.get(f"{BASE_URL}/v1/generations/gen_abc/audio").mock(
+    def test_iter_all_pages_through_history(self, client, respx_mock):
+        route = respx_mock.get("/v1/generations")
+        route.side_effect = [
+            httpx.Response(200, json={
+                "generations": [{"id": "gen_1"}, {"id": "gen_2"}], "total": 3,
+            }),
+            httpx.Response(200, json={
+                "generations": [{"id": "gen_3"}], "total": 3,
+            }),
+        ]
+        ids = [g.id for g in client.generations.iter_all(page_size=2)]
+        assert ids == ["gen_1", "gen_2", "gen_3"]
+        assert route.call_count == 2
+        assert route.calls.last.request.url.params["offset"] == "2"
+
+    def test_iter_all_follows_total_when_server_clamps_page_size(self, client, respx_mock):
+        route = respx_mock.get("/v1/generations")
+        route.side_effect = [
+            httpx.Response(200, json={"generations": [{"id": "gen_1"}, {"id": "gen_2"}], "total": 3}),
+            httpx.Response(200, json={"generations": [{"id": "gen_3"}], "total": 3}),
+        ]
+        ids = [g.id for g in client.generations.iter_all(page_size=100)]
+        assert ids == ["gen_1", "gen_2", "gen_3"]
+        assert route.call_count == 2
+
+    def test_iter_all_without_total_stops_on_short_page(self, client, respx_mock):
+        route = respx_mock.get("/v1/generations")
+        route.side_effect = [
+            httpx.Response(200, json={"generations": [{"id": "gen_1"}, {"id": "gen_2"}]}),
+            httpx.Response(200, json={"generations": [{"id": "gen_3"}], "total": 0}),
+        ]
+        ids = [g.id for g in client.generations.iter_all(page_size=2)]
+        assert ids == ["gen_1", "gen_2", "gen_3"]
+        assert route.call_count == 2
+
+    def test_get_audio(self, client, respx_mock):
+        respx_mock.get("/v1/generations/gen_abc/audio").mock(
             return_value=httpx.Response(200, json={
                 "id": "gen_abc",
                 "audio_url": "https://cdn.leanvox.com/audio/gen_abc.mp3",
@@ -297,9 +355,8 @@ class TestGenerationsResource:
         assert isinstance(gen, Generation)
         assert gen.audio_url == "https://cdn.leanvox.com/audio/gen_abc.mp3"
 
-    @respx.mock
-    def test_delete_generation(self, client):
-        route = respx.delete(f"{BASE_URL}/v1/generations/gen_del").mock(
+    def test_delete_generation(self, client, respx_mock):
+        route = respx_mock.delete("/v1/generations/gen_del").mock(
             return_value=httpx.Response(204)
         )
         client.generations.delete("gen_del")
@@ -307,9 +364,8 @@ class TestGenerationsResource:
 
 
 class TestAccountResource:
-    @respx.mock
-    def test_balance(self, client):
-        respx.get(f"{BASE_URL}/v1/account/balance").mock(
+    def test_balance(self, client, respx_mock):
+        respx_mock.get("/v1/account/balance").mock(
             return_value=httpx.Response(200, json={
                 "balance_cents": 4500,
                 "total_spent_cents": 1250,
@@ -320,9 +376,8 @@ class TestAccountResource:
         assert balance.balance_cents == 4500
         assert balance.total_spent_cents == 1250
 
-    @respx.mock
-    def test_usage(self, client):
-        respx.get(f"{BASE_URL}/v1/account/usage").mock(
+    def test_usage(self, client, respx_mock):
+        respx_mock.get("/v1/account/usage").mock(
             return_value=httpx.Response(200, json={
                 "entries": [
                     {"date": "2025-01-15", "characters": 5000, "cost_cents": 25},
@@ -335,9 +390,8 @@ class TestAccountResource:
         assert len(usage.entries) == 2
         assert usage.entries[0]["characters"] == 5000
 
-    @respx.mock
-    def test_usage_with_filters(self, client):
-        route = respx.get(f"{BASE_URL}/v1/account/usage").mock(
+    def test_usage_with_filters(self, client, respx_mock):
+        route = respx_mock.get("/v1/account/usage").mock(
             return_value=httpx.Response(200, json={"entries": []})
         )
         client.account.usage(days=7, model="pro", limit=50)
@@ -346,9 +400,27 @@ class TestAccountResource:
         assert params["model"] == "pro"
         assert params["limit"] == "50"
 
-    @respx.mock
-    def test_buy_credits(self, client):
-        respx.post(f"{BASE_URL}/v1/billing/checkout").mock(
+    def test_usage_totals(self, client, respx_mock):
+        respx_mock.get("/v1/account/usage").mock(
+            return_value=httpx.Response(200, json={
+                "entries": [
+                    {"date": "2025-01-15", "model": "pro", "characters": 5000, "cost_cents": 25},
+                    {"date": "2025-01-14", "model": "standard", "characters": 3000, "cost_cents": 15},
+                    {"date": "2025-01-13", "model": "pro", "characters": 1000, "cost_cents": 5},
+                ],
+            })
+        )
+        totals = client.account.usage_totals()
+        assert isinstance(totals, AccountUsageTotals)
+        assert totals.characters == 9000
+        assert totals.cost_cents == 45
+        assert totals.by_model == {
+            "pro": AccountUsageTotals(characters=6000, cost_cents=30),
+            "standard": AccountUsageTotals(characters=3000, cost_cents=15),
+        }
+
+    def test_buy_credits(self, client, respx_mock):
+        respx_mock.post("/v1/billing/checkout").mock(
             return_value=httpx.Response(200, json={
                 "checkout_url": "https://checkout.stripe.com/session_abc",
             })
@@ -356,11 +428,10 @@ class TestAccountResource:
         result = client.account.buy_credits(2000)
         assert result["checkout_url"] == "https://checkout.stripe.com/session_abc"
 
-    @respx.mock
-    def test_buy_credits_sends_amount(self, client):
-        route = respx.post(f"{BASE_URL}/v1/billing/checkout").mock(
+    def test_buy_credits_sends_amount(self, client, respx_mock):
+        route = respx_mock.post("/v1/billing/checkout").mock(
             return_value=httpx.Response(200, json={"checkout_url": ""})
         )
         client.account.buy_credits(5000)
-        payload = json.loads(route.calls.last.request.content)
+        payload = last_payload(route)
         assert payload["amount_cents"] == 5000
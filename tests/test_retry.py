@@ -1,26 +1,33 @@
 """Tests for retry logic — 5xx, 429, exponential backoff, Retry-After header."""
 
-from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 
 import httpx
 import pytest
-import respx
 
 from leanvox import Leanvox
 from leanvox.errors import LeanvoxError, RateLimitError, ServerError
 
-BASE_URL = "https://api.leanvox.com"
-API_KEY = "lv_live_test_key_123"
+from .conftest import API_KEY, BASE_URL
 
+# Routes are declared relative to the API, as in the client tests.
+pytestmark = pytest.mark.respx(base_url=BASE_URL, assert_all_called=False)
 
-@pytest.fixture
-def client():
-    c = Leanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=2)
-    yield c
-    c.close()
+# Error body well over the client's 64 KB parsing guard.
+_OVERSIZED_BODY = b"x" * 100_000
+
+_OK_PAYLOAD = {"audio_url": "", "model": "standard", "voice": "", "characters": 5, "cost_cents": 0}
+_OK_PAYLOAD_WITH_URL = {**_OK_PAYLOAD, "audio_url": "https://cdn.leanvox.com/ok.mp3"}
 
 
 @pytest.fixture
+def generate_route(respx_mock):
+    """The generate endpoint every retry test drives."""
+    return respx_mock.post("/v1/tts/generate")
+
+
+@pytest.fixture(scope="module")
 def client_no_retry():
     c = Leanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=0)
     yield c
@@ -28,255 +35,237 @@ def client_no_retry():
 
 
 class TestRetryOn5xx:
-    @respx.mock
-    def test_retries_on_500_then_succeeds(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
-            httpx.Response(500, json={"error": {"message": "Internal error", "code": "server_error"}}),
-            httpx.Response(200, json={
-                "audio_url": "https://cdn.leanvox.com/ok.mp3",
-                "model": "standard", "voice": "", "characters": 5, "cost_cents": 0,
-            }),
-        ]
-        with patch("time.sleep"):
-            result = client.generate("Hello")
-        assert result.audio_url == "https://cdn.leanvox.com/ok.mp3"
-        assert route.call_count == 2
-
-    @respx.mock
-    def test_retries_on_502(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
-            httpx.Response(502, json={"error": {"message": "Bad gateway"}}),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+    @pytest.mark.parametrize("status", [500, 502, 503, 504])
+    def test_retries_on_5xx(self, client, generate_route, status):
+        generate_route.side_effect = [
+            httpx.Response(status, json={"error": {"message": "err"}}),
+            httpx.Response(200, json=_OK_PAYLOAD),
         ]
-        with patch("time.sleep"):
-            client.generate("Hello")
-        assert route.call_count == 2
-
-    @respx.mock
-    def test_retries_on_503(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
-            httpx.Response(503, json={"error": {"message": "Service unavailable"}}),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
-        ]
-        with patch("time.sleep"):
-            client.generate("Hello")
-        assert route.call_count == 2
-
-    @respx.mock
-    def test_retries_on_504(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
-            httpx.Response(504, json={"error": {"message": "Gateway timeout"}}),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
-        ]
-        with patch("time.sleep"):
-            client.generate("Hello")
-        assert route.call_count == 2
+        client.generate("Hello")
+        assert generate_route.call_count == 2
 
-    @respx.mock
-    def test_exhausts_retries_then_raises(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_exhausts_retries_then_raises(self, client, generate_route):
+        generate_route.mock(
             return_value=httpx.Response(500, json={
                 "error": {"message": "Internal error", "code": "server_error"},
             })
         )
-        with patch("time.sleep"):
-            with pytest.raises(ServerError, match="Internal error"):
-                client.generate("Hello")
+        with pytest.raises(ServerError, match="Internal error"):
+            client.generate("Hello")
 
-    @respx.mock
-    def test_no_retry_on_500_when_max_retries_zero(self, client_no_retry):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_no_retry_on_500_when_max_retries_zero(self, client_no_retry, generate_route):
+        generate_route.mock(
             return_value=httpx.Response(500, json={
                 "error": {"message": "Internal error", "code": "server_error"},
             })
         )
         with pytest.raises(ServerError):
             client_no_retry.generate("Hello")
-        assert route.call_count == 1
+        assert generate_route.call_count == 1
 
 
 class TestRetryOn429:
-    @respx.mock
-    def test_retries_on_429_then_succeeds(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
+    def test_retries_on_429_then_succeeds(self, client, generate_route):
+        generate_route.side_effect = [
             httpx.Response(429, json={
                 "error": {"message": "Rate limited", "code": "rate_limit", "retry_after": 1},
             }),
-            httpx.Response(200, json={
-                "audio_url": "https://cdn.leanvox.com/ok.mp3",
-                "model": "standard", "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+            httpx.Response(200, json=_OK_PAYLOAD_WITH_URL),
         ]
-        with patch("time.sleep"):
-            result = client.generate("Hello")
+        result = client.generate("Hello")
         assert result.audio_url == "https://cdn.leanvox.com/ok.mp3"
-        assert route.call_count == 2
+        assert generate_route.call_count == 2
 
-    @respx.mock
-    def test_429_exhausted_raises_rate_limit_error(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_429_exhausted_raises_rate_limit_error(self, client, generate_route):
+        generate_route.mock(
             return_value=httpx.Response(429, json={
                 "error": {"message": "Rate limited", "code": "rate_limit", "retry_after": 1},
             })
         )
-        with patch("time.sleep"):
-            with pytest.raises(RateLimitError, match="Rate limited"):
-                client.generate("Hello")
+        with pytest.raises(RateLimitError, match="Rate limited"):
+            client.generate("Hello")
 
 
 class TestNoRetryOn4xx:
-    @respx.mock
-    def test_no_retry_on_400(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
-            return_value=httpx.Response(400, json={
-                "error": {"message": "Bad request", "code": "invalid_request"},
-            })
+    @pytest.mark.parametrize("status", [400, 401, 404])
+    def test_no_retry_on_4xx(self, client, generate_route, status):
+        generate_route.mock(
+            return_value=httpx.Response(status, json={"error": {"message": "err"}})
         )
         with pytest.raises(LeanvoxError):
             client.generate("Hello")
-        assert route.call_count == 1
+        assert generate_route.call_count == 1
 
-    @respx.mock
-    def test_no_retry_on_401(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
-            return_value=httpx.Response(401, json={
-                "error": {"message": "Unauthorized", "code": "auth_error"},
-            })
+    def test_oversized_error_body_is_truncated(self, client, generate_route):
+        generate_route.mock(
+            return_value=httpx.Response(413, content=_OVERSIZED_BODY)
         )
-        with pytest.raises(LeanvoxError):
+        with pytest.raises(LeanvoxError) as exc_info:
             client.generate("Hello")
-        assert route.call_count == 1
-
-    @respx.mock
-    def test_no_retry_on_404(self, client):
-        route = respx.get(f"{BASE_URL}/v1/jobs/nonexistent").mock(
-            return_value=httpx.Response(404, json={
-                "error": {"message": "Not found", "code": "not_found"},
-            })
-        )
-        with pytest.raises(LeanvoxError):
-            client.get_job("nonexistent")
-        assert route.call_count == 1
+        assert exc_info.value.status_code == 413
+        assert len(exc_info.value.message) == 1024
 
 
 class TestExponentialBackoff:
-    @respx.mock
-    def test_backoff_increases(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
+    def test_backoff_increases(self, client, generate_route, sleep_calls):
+        generate_route.side_effect = [
             httpx.Response(500, json={"error": {"message": "err"}}),
             httpx.Response(500, json={"error": {"message": "err"}}),
             httpx.Response(500, json={"error": {"message": "err"}}),
         ]
-        sleep_calls = []
-        with patch("time.sleep", side_effect=lambda t: sleep_calls.append(t)):
-            with pytest.raises(ServerError):
-                client.generate("Hello")
+        with pytest.raises(ServerError):
+            client.generate("Hello")
         # Should have slept twice (before retry 1 and retry 2)
         assert len(sleep_calls) == 2
-        # Backoff base: [1.0, 2.0, 4.0] → attempt 0 = 1.0, attempt 1 = 2.0
-        assert sleep_calls[0] == 1.0
-        assert sleep_calls[1] == 2.0
-
-    @respx.mock
-    def test_retry_after_header_respected(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
+        # Backoff base: [1.0, 2.0, 4.0] with equal jitter (50%-150% of base)
+        assert 0.5 <= sleep_calls[0] <= 1.5
+        assert 1.0 <= sleep_calls[1] <= 3.0
+
+    def test_retry_after_header_respected(self, client, generate_route, sleep_calls):
+        generate_route.side_effect = [
             httpx.Response(
                 429,
                 json={"error": {"message": "Rate limited", "code": "rate_limit", "retry_after": 5}},
                 headers={"Retry-After": "3.5"},
             ),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+            httpx.Response(200, json=_OK_PAYLOAD),
         ]
-        sleep_calls = []
-        with patch("time.sleep", side_effect=lambda t: sleep_calls.append(t)):
-            client.generate("Hello")
+        client.generate("Hello")
         # Should respect Retry-After header value 3.5 instead of default backoff 1.0
         assert len(sleep_calls) == 1
         assert sleep_calls[0] == 3.5
 
-    @respx.mock
-    def test_backoff_without_retry_after_header(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
+    def test_backoff_without_retry_after_header(self, client, generate_route, sleep_calls):
+        generate_route.side_effect = [
             httpx.Response(500, json={"error": {"message": "err"}}),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+            httpx.Response(200, json=_OK_PAYLOAD),
         ]
-        sleep_calls = []
-        with patch("time.sleep", side_effect=lambda t: sleep_calls.append(t)):
-            client.generate("Hello")
-        # Without Retry-After, uses backoff base: attempt 0 = 1.0
-        assert sleep_calls[0] == 1.0
+        client.generate("Hello")
+        # Without Retry-After, uses jittered backoff base: attempt 0 = 1.0 ± 50%
+        assert 0.5 <= sleep_calls[0] <= 1.5
+
+    @pytest.mark.parametrize("retry_after", ["nan", "inf", "-inf"])
+    def test_non_finite_retry_after_uses_backoff(self, client, generate_route, sleep_calls, retry_after):
+        generate_route.side_effect = [
+            httpx.Response(503, json={"error": {"message": "err"}}, headers={"Retry-After": retry_after}),
+            httpx.Response(200, json=_OK_PAYLOAD),
+        ]
+        client.generate("Hello")
+        assert 0.5 <= sleep_calls[0] <= 1.5
+
+    def test_retry_after_header_clamped(self, client, generate_route, sleep_calls):
+        generate_route.side_effect = [
+            httpx.Response(
+                429,
+                json={"error": {"message": "Rate limited", "code": "rate_limit"}},
+                headers={"Retry-After": "3600"},
+            ),
+            httpx.Response(200, json=_OK_PAYLOAD),
+        ]
+        client.generate("Hello")
+        assert sleep_calls[0] == 30.0
+
+    def test_retry_after_http_date(self, client, generate_route, sleep_calls):
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+        generate_route.side_effect = [
+            httpx.Response(
+                503,
+                json={"error": {"message": "Unavailable"}},
+                headers={"Retry-After": retry_at},
+            ),
+            httpx.Response(200, json=_OK_PAYLOAD),
+        ]
+        client.generate("Hello")
+        assert 5.0 < sleep_calls[0] <= 10.0
 
 
 class TestConnectionRetry:
-    @respx.mock
-    def test_retries_on_connect_error(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
+    def test_retries_on_connect_error(self, client, generate_route):
+        generate_route.side_effect = [
             httpx.ConnectError("Connection refused"),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+            httpx.Response(200, json=_OK_PAYLOAD),
         ]
-        with patch("time.sleep"):
-            result = client.generate("Hello")
+        result = client.generate("Hello")
         assert result is not None
 
-    @respx.mock
-    def test_retries_on_timeout(self, client):
-        route = respx.post(f"{BASE_URL}/v1/tts/generate")
-        route.side_effect = [
-            httpx.TimeoutException("Request timed out"),
-            httpx.Response(200, json={
-                "audio_url": "", "model": "standard",
-                "voice": "", "characters": 5, "cost_cents": 0,
-            }),
+    def test_retries_on_timeout(self, client, generate_route):
+        generate_route.side_effect = [
+            httpx.ReadTimeout("Request timed out"),
+            httpx.Response(200, json=_OK_PAYLOAD),
         ]
-        with patch("time.sleep"):
-            result = client.generate("Hello")
+        result = client.generate("Hello")
         assert result is not None
 
-    @respx.mock
-    def test_connection_error_exhausted(self, client):
-        respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+    def test_no_retry_on_write_timeout(self, client, generate_route):
+        generate_route.mock(
+            side_effect=httpx.WriteTimeout("Write timed out")
+        )
+        with pytest.raises(LeanvoxError, match="Connection failed"):
+            client.generate("Hello")
+        assert generate_route.call_count == 1
+
+    def test_custom_should_retry(self, generate_route):
+        generate_route.side_effect = [
+            httpx.WriteTimeout("Write timed out"),
+            httpx.Response(200, json=_OK_PAYLOAD),
+        ]
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL, should_retry=lambda e: True) as client:
+            client.generate("Hello")
+        assert generate_route.call_count == 2
+
+    def test_connection_error_exhausted(self, client, generate_route):
+        generate_route.mock(
             side_effect=httpx.ConnectError("Connection refused")
         )
-        with patch("time.sleep"):
-            with pytest.raises(LeanvoxError, match="Connection failed"):
-                client.generate("Hello")
+        with pytest.raises(LeanvoxError, match="Connection failed"):
+            client.generate("Hello")
 
 
 class TestRetryCount:
-    @respx.mock
-    def test_total_attempts_is_max_retries_plus_one(self, client):
+    def test_total_attempts_is_max_retries_plus_one(self, client, generate_route):
         """With max_retries=2, there should be 3 total attempts."""
-        route = respx.post(f"{BASE_URL}/v1/tts/generate").mock(
+        generate_route.mock(
             return_value=httpx.Response(500, json={"error": {"message": "err"}})
         )
-        with patch("time.sleep"):
-            with pytest.raises(ServerError):
+        with pytest.raises(ServerError):
+            client.generate("Hello")
+        assert generate_route.call_count == 3  # 1 initial + 2 retries
+
+
+class TestRetryBudget:
+    def test_max_backoff_caps_wait(self, generate_route, sleep_calls):
+        generate_route.side_effect = [
+            httpx.Response(
+                429,
+                json={"error": {"message": "Rate limited", "code": "rate_limit"}},
+                headers={"Retry-After": "3600"},
+            ),
+            httpx.Response(200, json=_OK_PAYLOAD),
+        ]
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL, max_backoff=5.0) as client:
+            client.generate("Hello")
+        assert sleep_calls == [5.0]
+
+    def test_total_timeout_raises_deadline_exceeded(self, generate_route, fake_clock):
+        generate_route.mock(
+            return_value=httpx.Response(500, json={"error": {"message": "err"}})
+        )
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL, max_retries=5, total_timeout=2.0) as client:
+            with pytest.raises(LeanvoxError) as exc_info:
+                client.generate("Hello")
+        assert exc_info.value.code == "deadline_exceeded"
+        assert sum(fake_clock.sleeps) < 2.0
+        assert generate_route.call_count < 6
+
+    def test_wait_past_deadline_raises_without_sleeping(self, generate_route, fake_clock):
+        generate_route.mock(
+            return_value=httpx.Response(
+                503, json={"error": {"message": "Unavailable"}}, headers={"Retry-After": "10"},
+            )
+        )
+        with Leanvox(api_key=API_KEY, base_url=BASE_URL, total_timeout=5.0) as client:
+            with pytest.raises(LeanvoxError) as exc_info:
                 client.generate("Hello")
-        assert route.call_count == 3  # 1 initial + 2 retries
+        assert exc_info.value.code == "deadline_exceeded"
+        assert fake_clock.sleeps == []
+        assert generate_route.call_count == 1